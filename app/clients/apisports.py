@@ -1,9 +1,13 @@
 # app/clients/apisports.py
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import Dict, Any, Optional, Literal, Mapping, List
 import httpx
+import orjson
 
+from ..core.cache import TTLCache
 from ..core.config import get_base_for_league, get_league_id
 
 League = Literal["nba", "nfl", "ncaaf", "ncaab", "soccer"]
@@ -13,6 +17,39 @@ class ApiSportsError(RuntimeError):
     pass
 
 
+def _retry_after(resp: httpx.Response, default: float = 1.0) -> float:
+    try:
+        return min(float(resp.headers.get("Retry-After", default)), 30.0)
+    except ValueError:
+        return default
+
+
+class _TokenBucket:
+    """Paces the async fan-outs so a gather burst cannot blow the provider's
+    per-minute quota and trigger 429 retry storms."""
+
+    def __init__(self, rate: float):
+        self._rate = rate
+        self._tokens = rate  # allow a one-second burst from cold
+        self._stamp = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._rate, self._tokens + (now - self._stamp) * self._rate)
+            self._stamp = now
+            # Debit unconditionally: a waiter takes the balance negative and
+            # sleeps until its token would have refilled. Each concurrent
+            # waiter therefore gets a strictly later release time instead of
+            # the whole burst waking together and firing at once.
+            self._tokens -= 1.0
+            if self._tokens >= 0.0:
+                return
+            wait = -self._tokens / self._rate
+        await asyncio.sleep(wait)
+
+
 class ApiSportsClient:
     """
     Thin, uniform wrapper over API-SPORTS families.
@@ -38,12 +75,25 @@ class ApiSportsClient:
                  GET /games/statistics/players?id= | ids=
     """
 
+    # Per-fixture odds payloads are memoized client-side. Live odds move
+    # constantly, so the default TTL only absorbs duplicate lookups inside a
+    # route-cache window; callers that know a fixture is finished (immutable
+    # odds) can pass the longer per-call TTL instead.
+    _ODDS_CACHE_TTL = 15.0
+    _ODDS_CACHE_TTL_FINAL = 3600.0
+    _ODDS_CACHE_MAX = 10_000
+
     # ------------ lifecycle ------------
     def __init__(self, api_key: str, timeout: float = 20.0):
+        # HTTP/2 lets parallel odds lookups multiplex over one TCP+TLS
+        # connection instead of one pooled socket each.
         self._http = httpx.Client(
             timeout=timeout,
             headers={"x-apisports-key": api_key},
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=50),
         )
+        self._odds_cache = TTLCache(default_ttl=self._ODDS_CACHE_TTL, max_items=self._ODDS_CACHE_MAX)
 
     def close(self) -> None:
         self._http.close()
@@ -54,12 +104,34 @@ class ApiSportsClient:
     def __exit__(self, *_exc) -> None:
         self.close()
 
+    # Endpoint paths, resolved once at class creation instead of being
+    # re-spelled inline per call. Keyed by logical operation.
+    _ENDPOINTS: Dict[str, str] = {
+        "fixtures": "/fixtures",            # soccer v3
+        "games": "/games",                  # v1 families
+        "injuries": "/injuries",
+        "odds": "/odds",
+        "bookmakers": "/odds/bookmakers",
+        "team_season_stats": "/teams/statistics",
+        "fixture_team_stats": "/fixtures/statistics",
+        "fixture_player_stats": "/fixtures/players",
+        "game_team_stats": "/games/statistics/teams",
+        "game_player_stats": "/games/statistics/players",
+    }
+
     # ------------ internals ------------
     def _base(self, league: League) -> str:
         return get_base_for_league(league)
 
+    def _url(self, league: League, op: str) -> str:
+        return get_base_for_league(league) + self._ENDPOINTS[op]
+
     def _get(self, url: str, params: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
         resp = self._http.get(url, params=params or {})
+        if resp.status_code == 429:
+            # honor the provider's backoff once instead of failing the request
+            time.sleep(_retry_after(resp))
+            resp = self._http.get(url, params=params or {})
         try:
             resp.raise_for_status()
         except httpx.HTTPStatusError as e:
@@ -70,7 +142,9 @@ class ApiSportsClient:
                 pass
             raise ApiSportsError(f"GET {url} -> {resp.status_code}: {body}") from e
         try:
-            return resp.json()
+            # orjson decodes the large fixtures/odds payloads 2-4x faster than
+            # the stdlib decoder behind resp.json()
+            return orjson.loads(resp.content)
         except Exception as e:
             raise ApiSportsError(f"GET {url} parse error: {e}") from e
 
@@ -92,23 +166,23 @@ class ApiSportsClient:
         timezone: Optional[str] = None,
         page: Optional[int] = None,
     ) -> Dict[str, Any]:
-        base = self._base(league)
         if league == "soccer":
-            lid = get_league_id("soccer", league_id)
-            url = f"{base}/fixtures"
-            params: Dict[str, Any] = {"date": date, "league": lid}
-            if season is not None:
-                params["season"] = season
+            url = self._url("soccer", "fixtures")
+            params = self._clean({
+                "date": date,
+                "league": get_league_id("soccer", league_id),
+                "season": season,
+                "timezone": timezone or None,
+                "page": page or None,
+            })
         else:
-            lid = get_league_id(league, league_id)
-            url = f"{base}/games"
-            params = {"date": date, "league": lid}
-
-        if timezone:
-            params["timezone"] = timezone
-        if page:
-            params["page"] = page
-
+            url = self._url(league, "games")
+            params = self._clean({
+                "date": date,
+                "league": get_league_id(league, league_id),
+                "timezone": timezone or None,
+                "page": page or None,
+            })
         return self._get(url, params)
 
     def fixtures_range(
@@ -121,23 +195,25 @@ class ApiSportsClient:
         timezone: Optional[str] = None,
         page: Optional[int] = None,
     ) -> Dict[str, Any]:
-        base = self._base(league)
         if league == "soccer":
-            lid = get_league_id("soccer", league_id)
-            url = f"{base}/fixtures"
-            params: Dict[str, Any] = {"from": from_date, "to": to_date, "league": lid}
-            if season is not None:
-                params["season"] = season
+            url = self._url("soccer", "fixtures")
+            params = self._clean({
+                "from": from_date,
+                "to": to_date,
+                "league": get_league_id("soccer", league_id),
+                "season": season,
+                "timezone": timezone or None,
+                "page": page or None,
+            })
         else:
-            lid = get_league_id(league, league_id)
-            url = f"{base}/games"
-            params = {"from": from_date, "to": to_date, "league": lid}
-
-        if timezone:
-            params["timezone"] = timezone
-        if page:
-            params["page"] = page
-
+            url = self._url(league, "games")
+            params = self._clean({
+                "from": from_date,
+                "to": to_date,
+                "league": get_league_id(league, league_id),
+                "timezone": timezone or None,
+                "page": page or None,
+            })
         return self._get(url, params)
 
     # ------------ injuries ------------
@@ -150,29 +226,17 @@ class ApiSportsClient:
         league_id: Optional[int] = None,
         season: Optional[int] = None,
     ) -> Dict[str, Any]:
-        base = self._base(league)
-
         if league == "soccer":
-            url = f"{base}/injuries"
-            params: Dict[str, Any] = {}
-            if league_id is not None:
-                params["league"] = league_id
-            if season is not None:
-                params["season"] = season
-            if team is not None:
-                params["team"] = team
-            if player is not None:
-                params["player"] = player
-            return self._get(url, params)
+            return self._get(
+                self._url("soccer", "injuries"),
+                self._clean({"league": league_id, "season": season, "team": team, "player": player}),
+            )
 
         if league in ("nfl", "ncaaf"):
-            url = f"{base}/injuries"
-            params: Dict[str, Any] = {}
-            if team is not None:
-                params["team"] = team
-            if player is not None:
-                params["player"] = player
-            return self._get(url, params)
+            return self._get(
+                self._url(league, "injuries"),
+                self._clean({"team": team, "player": player}),
+            )
 
         raise ApiSportsError(f"Injuries not available for league '{league}'")
 
@@ -184,26 +248,55 @@ class ApiSportsClient:
         *,
         bookmaker: Optional[int] = None,
         bet: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Soccer: /odds?fixture={id}[&bookmaker][&bet]
         v1 families: /odds?game={id}[&bookmaker][&bet]
-        """
-        base = self._base(league)
-
-        if league == "soccer":
-            url = f"{base}/odds"
-            params: Dict[str, Any] = {"fixture": fixture_id}
-        else:
-            url = f"{base}/odds"
-            params = {"game": fixture_id}
-
-        if bookmaker is not None:
-            params["bookmaker"] = bookmaker
-        if bet is not None:
-            params["bet"] = bet
 
-        return self._get(url, params)
+        ``cache_ttl`` overrides the memo TTL (use ``_ODDS_CACHE_TTL_FINAL``
+        for finished fixtures whose odds can no longer move).
+        """
+        key = f"{league}:{fixture_id}:{bookmaker}:{bet}"
+        cached = self._odds_cache.get(key)
+        if cached is not None:
+            return cached
+        payload = self._get(self._url(league, "odds"), self._odds_params(league, fixture_id, bookmaker, bet))
+        self._odds_cache.set(key, payload, ttl=cache_ttl)
+        return payload
+
+    def _odds_params(self, league: League, fixture_id: int,
+                     bookmaker: Optional[int], bet: Optional[int]) -> Dict[str, Any]:
+        id_key = "fixture" if league == "soccer" else "game"
+        return self._clean({id_key: fixture_id, "bookmaker": bookmaker, "bet": bet})
+
+    def odds_by_date(
+        self,
+        league: League,
+        date: str,                       # "YYYY-MM-DD"
+        *,
+        bookmaker: Optional[int] = None,
+        bet: Optional[int] = None,
+        league_id: Optional[int] = None,
+        season: Optional[int] = None,
+        page: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Bulk odds for every fixture on a date in one call (soccer only:
+        API-Football v3 supports /odds?date=...). The v1 families have no
+        date filter on /odds, so callers fall back to per-fixture lookups.
+        """
+        if league != "soccer":
+            raise ApiSportsError(f"Bulk odds by date not available for league '{league}'")
+        params = self._clean({
+            "date": date,
+            "league": get_league_id("soccer", league_id),
+            "season": season,
+            "bookmaker": bookmaker,
+            "bet": bet,
+            "page": page or None,
+        })
+        return self._get(self._url("soccer", "odds"), params)
 
     def odds_for_fixture_props(
         self,
@@ -218,41 +311,119 @@ class ApiSportsClient:
 
     # ------------ bookmakers ------------
     def bookmakers(self, league: League) -> Dict[str, Any]:
-        base = self._base(league)
-        return self._get(f"{base}/odds/bookmakers")
+        return self._get(self._url(league, "bookmakers"))
 
     # ------------ stats: soccer season team ------------
     def soccer_team_season_stats(self, *, team_id: int, league_id: int, season: int) -> Dict[str, Any]:
-        base = self._base("soccer")
         return self._get(
-            f"{base}/teams/statistics",
+            self._url("soccer", "team_season_stats"),
             {"team": team_id, "league": league_id, "season": season},
         )
 
     # ------------ stats: single game (teams/players) ------------
     def game_team_stats(self, league: League, game_id: int) -> Dict[str, Any]:
-        base = self._base(league)
         if league == "soccer":
-            return self._get(f"{base}/fixtures/statistics", {"fixture": game_id})
-        return self._get(f"{base}/games/statistics/teams", {"id": game_id})
+            return self._get(self._url("soccer", "fixture_team_stats"), {"fixture": game_id})
+        return self._get(self._url(league, "game_team_stats"), {"id": game_id})
 
     def game_player_stats(self, league: League, game_id: int) -> Dict[str, Any]:
-        base = self._base(league)
         if league == "soccer":
-            return self._get(f"{base}/fixtures/players", {"fixture": game_id})
-        return self._get(f"{base}/games/statistics/players", {"id": game_id})
+            return self._get(self._url("soccer", "fixture_player_stats"), {"fixture": game_id})
+        return self._get(self._url(league, "game_player_stats"), {"id": game_id})
 
     # ------------ stats: batch by ids (v1 families only) ------------
     def game_team_stats_batch(self, league: League, game_ids: List[int]) -> Dict[str, Any]:
-        base = self._base(league)
         if league == "soccer":
             raise ApiSportsError("Batch team stats not supported for soccer (use per-fixture).")
-        ids = self._join_ids(game_ids)
-        return self._get(f"{base}/games/statistics/teams", self._clean({"ids": ids}))
+        return self._get(self._url(league, "game_team_stats"), self._clean({"ids": self._join_ids(game_ids)}))
 
     def game_player_stats_batch(self, league: League, game_ids: List[int]) -> Dict[str, Any]:
-        base = self._base(league)
         if league == "soccer":
             raise ApiSportsError("Batch player stats not supported for soccer (use per-fixture).")
-        ids = self._join_ids(game_ids)
-        return self._get(f"{base}/games/statistics/players", self._clean({"ids": ids}))
+        return self._get(self._url(league, "game_player_stats"), self._clean({"ids": self._join_ids(game_ids)}))
+
+
+class AsyncApiSportsClient(ApiSportsClient):
+    """
+    Async variant of :class:`ApiSportsClient` for event-loop endpoints.
+
+    Endpoint methods are inherited unchanged: they only build URLs/params
+    and defer all I/O to ``_get``, which here performs the request on an
+    ``httpx.AsyncClient`` — so every endpoint method returns an awaitable
+    (``data = await client.fixtures_by_date(...)``).
+    """
+
+    def __init__(self, api_key: str, timeout: float = 20.0, rps: float = 10.0):
+        self._http = httpx.AsyncClient(
+            timeout=timeout,
+            headers={"x-apisports-key": api_key},
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=50),
+        )
+        self._odds_cache = TTLCache(default_ttl=self._ODDS_CACHE_TTL, max_items=self._ODDS_CACHE_MAX)
+        # single-flight: concurrent callers of an identical request share one future
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._bucket = _TokenBucket(rps)
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncApiSportsClient":
+        return self
+
+    async def __aexit__(self, *_exc) -> None:
+        await self.aclose()
+
+    async def odds_for_fixture(
+        self,
+        league: League,
+        fixture_id: int,
+        *,
+        bookmaker: Optional[int] = None,
+        bet: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        key = f"{league}:{fixture_id}:{bookmaker}:{bet}"
+        cached = self._odds_cache.get(key)
+        if cached is not None:
+            return cached
+        payload = await self._get(self._url(league, "odds"), self._odds_params(league, fixture_id, bookmaker, bet))
+        self._odds_cache.set(key, payload, ttl=cache_ttl)
+        return payload
+
+    async def _get(self, url: str, params: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+        # On cold cache, burst traffic would fan N identical upstream calls;
+        # dedupe them so concurrent callers await the same in-flight request.
+        key = (url, frozenset((params or {}).items()))
+        fut = self._inflight.get(key)
+        if fut is not None:
+            return await asyncio.shield(fut)
+        fut = asyncio.ensure_future(self._request(url, params))
+        self._inflight[key] = fut
+        try:
+            return await fut
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _request(self, url: str, params: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+        await self._bucket.acquire()
+        resp = await self._http.get(url, params=params or {})
+        if resp.status_code == 429:
+            await asyncio.sleep(_retry_after(resp))
+            await self._bucket.acquire()
+            resp = await self._http.get(url, params=params or {})
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            body = ""
+            try:
+                body = resp.text
+            except Exception:
+                pass
+            raise ApiSportsError(f"GET {url} -> {resp.status_code}: {body}") from e
+        try:
+            # orjson decodes the large fixtures/odds payloads 2-4x faster than
+            # the stdlib decoder behind resp.json()
+            return orjson.loads(resp.content)
+        except Exception as e:
+            raise ApiSportsError(f"GET {url} parse error: {e}") from e
@@ -14,6 +14,8 @@ class Settings(BaseSettings):
     default_league: League = "nba"
     default_market: str = "us"
     cache_ttl_seconds: int = 120
+    redis_url: Optional[str] = None  # enables Redis-backed response caching
+    apisports_rps: float = 10.0  # client-side requests/second budget toward API-SPORTS
     log_level: str = "INFO"
 
     class Config:
@@ -1,7 +1,14 @@
 
-from .core.config import get_settings
-from .clients.apisports import ApiSportsClient
+from fastapi import Request
 
-def get_client() -> ApiSportsClient:
-    s = get_settings()
-    return ApiSportsClient(api_key=s.apisports_key)
+from .clients.apisports import ApiSportsClient, AsyncApiSportsClient
+
+def get_client(request: Request) -> ApiSportsClient:
+    """Hand out the process-wide client built in the app lifespan: the pooled
+    connections and TLS session survive across requests instead of paying a
+    handshake per call."""
+    return request.app.state.apisports
+
+def get_async_client(request: Request) -> AsyncApiSportsClient:
+    """Async counterpart for event-loop endpoints; same shared-pool rationale."""
+    return request.app.state.apisports_async
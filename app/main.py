@@ -1,10 +1,47 @@
 # app/main.py
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+from .clients.apisports import ApiSportsClient
+from .core.config import get_settings
 from .routers import health, picks, backtest, data
 from .routers import debug  # add import
 
+# Optional Redis-backed response cache (in-proc TTL cache is the fallback)
+try:
+    from fastapi_cache import FastAPICache
+    from fastapi_cache.backends.redis import RedisBackend
+    from redis import asyncio as aioredis
+except Exception:  # pragma: no cover - optional dependency
+    FastAPICache = None  # type: ignore[assignment]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+    # Fail fast at boot instead of re-checking the key on every request.
+    if not settings.apisports_key:
+        raise RuntimeError("APISPORTS_KEY missing")
+    if FastAPICache is not None and settings.redis_url:
+        FastAPICache.init(RedisBackend(aioredis.from_url(settings.redis_url)), prefix="sportyly")
+    # One sync client for the threadpool routers (backtest/debug) and the
+    # shared async client for event-loop routers (data/picks).
+    app.state.apisports = ApiSportsClient(api_key=settings.apisports_key)
+    app.state.apisports_async = data._client()
+    yield
+    # Release the shared upstream clients' pools once per process.
+    app.state.apisports.close()
+    await data.close_client()
+
 
-app = FastAPI(title="GPT Picks API", version="0.1.0")
+app = FastAPI(
+    title="GPT Picks API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # C-level JSON writer for every route
+)
 
 # Routers
 app.include_router(health.router)
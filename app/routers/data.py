@@ -1,19 +1,34 @@
 # app/routers/data.py
 from __future__ import annotations
 
-from typing import List, Optional, Dict, Any, Literal
-from datetime import date as _date
-
-from fastapi import APIRouter, Query, HTTPException, Depends
-
-from ..clients.apisports import ApiSportsClient
+import asyncio
+import hashlib
+import re
+import time
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import List, Optional, Dict, Any, Literal, get_args
+from datetime import date as _date, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import orjson
+from fastapi import APIRouter, Query, HTTPException, Depends, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from ..clients.apisports import AsyncApiSportsClient
+from ..schemas.common import FixtureRow
 from ..core.config import get_settings
 from ..services.odds import normalize_odds
-from ..services.resolve import resolve_fixture_id
-from ..services.validation import validate_league
+from ..services.resolve import resolve_fixture_id_async
 from ..services.markets import resolve_bet_id
 from ..schemas.query import SlateQuery, ResolveQuery, OddsQuery
 from ..services.cache import cache  # small in-proc TTL cache
+# Redis-backed response cache (optional; see app lifespan)
+try:
+    from fastapi_cache import FastAPICache
+except Exception:  # pragma: no cover - optional dependency
+    FastAPICache = None  # type: ignore[assignment]
 # Optional derived metric (endpoint guarded by import’s existence)
 try:
     from ..services.ratings import compute_efficiency
@@ -25,52 +40,231 @@ router = APIRouter(prefix="/data", tags=["data"])
 # Local League literal to avoid import cycles
 League = Literal["nba", "nfl", "ncaaf", "ncaab", "soccer"]
 
+# Validate/serialize slate rows in one adapter pass instead of per-item models
+_ROW_ADAPTER: TypeAdapter[List[FixtureRow]] = TypeAdapter(List[FixtureRow])
+
+# League re-validation for defense in depth runs on pydantic-core's C path,
+# built once at import (FastAPI has already enforced the Literal upstream).
+_LEAGUE_ADAPTER: TypeAdapter[League] = TypeAdapter(League)
+
+# Route-constant error payloads, allocated once instead of per rejected call
+# (the injuries table below follows the same pattern).
+_ERR_NEED_RESOLVE = HTTPException(
+    status_code=422,
+    detail="Provide fixture_id OR (date and at least one of home/away).",
+)
+_ERR_NEED_GAME_IDS = HTTPException(status_code=422, detail="Provide game_ids (dash-separated).")
+_ERR_NO_IDS = HTTPException(status_code=422, detail="No valid ids in game_ids.")
+_ERR_SOCCER_WINDOW = HTTPException(status_code=422, detail="Use /stats/soccer/team for soccer contexts.")
+
 
 # ---------- client/key helpers ----------
-def _client() -> ApiSportsClient:
+@lru_cache(maxsize=1)
+def _client() -> AsyncApiSportsClient:
+    """Process-wide client: connection pool + TLS state survive across requests."""
     settings = get_settings()
-    return ApiSportsClient(api_key=settings.apisports_key)
+    return AsyncApiSportsClient(api_key=settings.apisports_key, rps=settings.apisports_rps)
 
-def _ensure_key():
-    settings = get_settings()
-    if not settings.apisports_key:
-        raise HTTPException(status_code=500, detail="APISPORTS_KEY missing")
+async def close_client() -> None:
+    """Shutdown hook (see app lifespan); no-op if the client was never built."""
+    if _client.cache_info().currsize:
+        await _client().aclose()
+
+def _qkey(route: str, **params: Any) -> str:
+    """Deterministic cache key from a route name and its query params."""
+    return route + "".join(f":{k}={params[k]}" for k in sorted(params))
+
+# tz strings already seen and accepted; validation is a set probe after first use
+_VALIDATED_TZ: set = set()
+
+def _check_tz(tz: Optional[str]) -> None:
+    """Reject unknown IANA timezones locally instead of wasting an upstream call."""
+    if tz is None or tz in _VALIDATED_TZ:
+        return
+    try:
+        ZoneInfo(tz)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(status_code=422, detail=f"Unknown timezone: {tz}")
+    _VALIDATED_TZ.add(tz)
+
+def _today_iso() -> str:
+    """Today as YYYY-MM-DD without date.isoformat()'s per-call format machinery."""
+    t = _date.today()
+    return f"{t.year:04d}-{t.month:02d}-{t.day:02d}"
+
+
+# ---------- response cache (Redis when configured, in-proc otherwise) ----------
+def _redis_backend():
+    if FastAPICache is None:
+        return None
+    try:
+        return FastAPICache.get_backend()
+    except AssertionError:  # init() never ran (no redis_url configured)
+        return None
+
+async def _cache_get(key: str) -> Optional[Any]:
+    backend = _redis_backend()
+    if backend is None:
+        return cache.get(key)
+    raw = await backend.get(key)
+    return orjson.loads(raw) if raw else None
+
+async def _cache_set(key: str, value: Any, ttl: int) -> None:
+    backend = _redis_backend()
+    if backend is None:
+        cache.set(key, value, ttl=ttl)
+        return
+    await backend.set(key, orjson.dumps(value), expire=ttl)
+
+
+# Bound for concurrent per-fixture odds lookups in /data/history
+_ODDS_CONCURRENCY = 8
+
+# Max-age for responses whose underlying data can no longer change vs.
+# slow-moving "today" data.
+_CACHE_MAX_AGE_PAST = 86400
+_CACHE_MAX_AGE_LIVE = 30
+
+def _etag_of(payload: Any) -> str:
+    """Weak validator over the serialized payload (blake2b is the fastest
+    stdlib hash; collision-resistance beyond cache validation is not needed)."""
+    return hashlib.blake2b(orjson.dumps(payload), digest_size=8).hexdigest()
+
+def _etag_match(request: Request, response: Response, payload: Any) -> bool:
+    """Set the ETag header; True when the client already holds this payload."""
+    etag = _etag_of(payload)
+    response.headers["ETag"] = etag
+    return request.headers.get("if-none-match") == etag
+
+def _not_modified(response: Response) -> Response:
+    # a directly-returned Response skips the injected one, so re-attach the
+    # validator/caching headers the client should keep
+    return Response(status_code=304, headers=dict(response.headers))
+
+def _set_cache_control(response: Response, last_date: str) -> None:
+    """Attach a Cache-Control header sized to how stale the data can get."""
+    ttl = _CACHE_MAX_AGE_PAST if last_date < _today_iso() else _CACHE_MAX_AGE_LIVE
+    response.headers["Cache-Control"] = f"public, max-age={ttl}"
 
 
 # ---------- shape helpers ----------
-def _extract_game_row(league: League, g: Dict[str, Any]) -> Dict[str, Any]:
+def _as_int(v: Any) -> Optional[int]:
+    """int() only when needed: provider ids are usually already ints, and the
+    identity check skips the PyNumber conversion on that common case."""
+    if v is None:
+        return None
+    if v.__class__ is int:
+        return v
+    return int(v)
+
+
+@dataclass(slots=True)
+class GameRow:
+    """Normalized fixture row. Slots keep per-row overhead well under a dict's
+    (~96 vs ~230 bytes), which matters for multi-thousand-row history pulls;
+    orjson serializes dataclasses natively."""
+    fixture_id: Optional[int]
+    date: Optional[str]
+    home: Optional[str]
+    away: Optional[str]
+    venue_city: Optional[str]
+    home_score: Optional[int] = None
+    away_score: Optional[int] = None
+    odds: Optional[Dict[str, Any]] = None
+
+# Specialized per-league extractors: the hot loops index known payload
+# paths directly and only fall back to the defensive .get() chains when a
+# fixture deviates from the documented shape.
+def _extract_soccer(g: Dict[str, Any]) -> GameRow:
+    fx = g["fixture"]
+    fid = fx["id"]
+    try:
+        venue_city = fx["venue"]["city"]
+    except (KeyError, TypeError):
+        venue_city = None
+    teams = g["teams"]
+    return GameRow(
+        _as_int(fid),
+        fx["date"],
+        teams["home"]["name"],
+        teams["away"]["name"],
+        venue_city,
+    )
+
+def _extract_american(g: Dict[str, Any]) -> GameRow:
+    try:
+        fid = g["id"]
+        teams = g["teams"]
+        home = teams["home"]["name"]
+        away = teams["away"]["name"]
+    except (KeyError, TypeError):
+        return _extract_american_slow(g)
+    venue = g.get("venue")
+    return GameRow(
+        _as_int(fid),
+        g.get("date"),
+        home,
+        away,
+        venue.get("city") if isinstance(venue, dict) else None,
+    )
+
+def _extract_american_slow(g: Dict[str, Any]) -> GameRow:
+    """Defensive path for v1 payloads that nest fields under game/fixture."""
+    fid = g.get("id") or g.get("game", {}).get("id") or g.get("fixture", {}).get("id")
+    dt = g.get("date") or g.get("game", {}).get("date")
+    teams = g.get("teams") or {}
+    home = (teams.get("home") or {}).get("name") or (g.get("home") or {}).get("name")
+    away = (teams.get("away") or {}).get("name") or (g.get("away") or {}).get("name")
+    venue_city = ((g.get("venue") or {}) or (g.get("game") or {}).get("venue") or {}).get("city")
+    return GameRow(
+        _as_int(fid) if fid else None,
+        dt,
+        home,
+        away,
+        venue_city,
+    )
+
+_EXTRACTORS: Dict[str, Any] = {
+    "soccer": _extract_soccer,
+    "nba": _extract_american,
+    "ncaab": _extract_american,
+    "nfl": _extract_american,
+    "ncaaf": _extract_american,
+}
+
+def _extract_game_row(league: League, g: Dict[str, Any]) -> GameRow:
     """Normalize minimal game fields across families."""
-    if league == "soccer":
-        fid = g["fixture"]["id"]
-        dt = g["fixture"]["date"]
-        home = g["teams"]["home"]["name"]
-        away = g["teams"]["away"]["name"]
-        venue_city = ((g.get("fixture") or {}).get("venue") or {}).get("city")
-        return {
-            "fixture_id": int(fid),
-            "date": dt,
-            "home": home,
-            "away": away,
-            "venue_city": venue_city,
-        }
-    else:
-        fid = g.get("id") or g.get("game", {}).get("id") or g.get("fixture", {}).get("id")
-        dt = g.get("date") or g.get("game", {}).get("date")
-        teams = g.get("teams") or {}
-        home = (teams.get("home") or {}).get("name") or (g.get("home") or {}).get("name")
-        away = (teams.get("away") or {}).get("name") or (g.get("away") or {}).get("name")
-        venue_city = ((g.get("venue") or {}) or (g.get("game") or {}).get("venue") or {}).get("city")
-        return {
-            "fixture_id": int(fid) if fid else None,
-            "date": dt,
-            "home": home,
-            "away": away,
-            "venue_city": venue_city,
-        }
+    return _EXTRACTORS[league](g)
+
+def _scores_soccer(g: Dict[str, Any]) -> tuple:
+    goals = g.get("goals") or {}
+    return goals.get("home"), goals.get("away")
+
+def _scores_american(g: Dict[str, Any]) -> tuple:
+    sc = g.get("scores") or g.get("score") or {}
+    hsc = sc.get("home")
+    asc = sc.get("away")
+    return (
+        hsc.get("total") if isinstance(hsc, dict) else hsc,
+        asc.get("total") if isinstance(asc, dict) else asc,
+    )
 
+# Bound per league like _EXTRACTORS: history hoists the lookup out of its loop.
+_SCORE_EXTRACTORS = {
+    "soccer": _scores_soccer,
+    "nba": _scores_american,
+    "ncaab": _scores_american,
+    "nfl": _scores_american,
+    "ncaaf": _scores_american,
+}
 
-def _auto_resolve_or_id(
-    client: ApiSportsClient,
+def _extract_scores(league: League, g: Dict[str, Any]) -> tuple:
+    """(home, away) final scores; handles goals/scores/score payload variants."""
+    return _SCORE_EXTRACTORS[league](g)
+
+
+async def _auto_resolve_or_id(
+    client: AsyncApiSportsClient,
     league: League,
     fixture_id: Optional[int],
     *,
@@ -79,21 +273,19 @@ def _auto_resolve_or_id(
     away: Optional[str],
     league_id_override: Optional[int],
     season: Optional[int],
-) -> Dict[str, Any]:
+) -> tuple:
     """
-    Returns dict with:
-      fixture_id, resolved (reason or None), candidates (if not resolvable)
+    Returns (fixture_id, picked_reason-or-None). The hot path — caller already
+    has the id — allocates just the tuple instead of a three-key dict whose
+    candidates/resolved entries nobody reads.
     """
     if fixture_id is not None:
-        return {"fixture_id": int(fixture_id), "resolved": None, "candidates": []}
+        return _as_int(fixture_id), None
 
     if not date or not (home or away):
-        raise HTTPException(
-            status_code=422,
-            detail="Provide fixture_id OR (date and at least one of home/away).",
-        )
+        raise _ERR_NEED_RESOLVE
 
-    res = resolve_fixture_id(
+    res = await resolve_fixture_id_async(
         client,
         league=league,
         date=date,
@@ -111,77 +303,146 @@ def _auto_resolve_or_id(
                 "candidates": res.get("candidates", []),
             },
         )
-    return {"fixture_id": int(fid), "resolved": res.get("picked_reason"), "candidates": []}
+    return _as_int(fid), res.get("picked_reason")
 
 
 # ---------------- Bookmakers ----------------
+_BOOKMAKERS_KEYS = {l: _qkey("bookmakers", league=l) for l in get_args(League)}
+
 @router.get(
     "/bookmakers",
     summary="List bookmaker IDs for a league",
     description="Returns the API-SPORTS bookmaker catalog (id, name) for the selected league.",
 )
-def bookmakers(league: League = Query(..., description="nba | nfl | ncaaf | ncaab | soccer")):
-    validate_league(league)
-    _ensure_key()
+async def bookmakers(
+    request: Request,
+    response: Response,
+    league: League = Query(..., description="nba | nfl | ncaaf | ncaab | soccer"),
+):
+    _LEAGUE_ADAPTER.validate_python(league)
 
-    key = ("bookmakers", league)
-    cached = cache.get(key)
+    key = _BOOKMAKERS_KEYS[league]
+    cached = await _cache_get(key)
     if cached is not None:
+        if _etag_match(request, response, cached):
+            return _not_modified(response)
         return cached
 
     c = _client()
-    try:
-        payload = c.bookmakers(league)
-        rows = payload.get("response") or payload.get("bookmakers") or []
-        out = [{"id": int(b.get("id")), "name": b.get("name")} for b in rows if b.get("id")]
-        out.sort(key=lambda x: (x["name"] or "").lower())
-        result = {"count": len(out), "league": league, "items": out}
-        cache.set(key, result)
-        return result
-    finally:
-        c.close()
+    payload = await c.bookmakers(league)
+    rows = payload.get("response") or payload.get("bookmakers") or []
+    out = [{"id": int(b.get("id")), "name": b.get("name")} for b in rows if b.get("id")]
+    out.sort(key=lambda x: (x["name"] or "").lower())
+    result = {"count": len(out), "league": league, "items": out}
+    await _cache_set(key, result, ttl=3600)  # the catalog barely changes
+    if _etag_match(request, response, result):
+        return _not_modified(response)
+    return result
 
 
 # ---------------- Slate (daily fixtures) ----------------
+async def _slate_payload(
+    q: SlateQuery,
+    timezone: Optional[str] = None,
+    page: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Assemble (and cache) the slate payload; shared by /slate and /batch."""
+    _check_tz(timezone)
+    qdate = q.date or _today_iso()
+
+    key = f"slate:{q.league}:{qdate}:{q.season}:{q.league_id_override}:{timezone}:{page}"
+    cached = await _cache_get(key)
+    if cached is not None:
+        return cached
+
+    client = _client()
+    fx = await client.fixtures_by_date(
+        league=q.league,
+        date=qdate,
+        season=q.season,
+        league_id=q.league_id_override,
+        timezone=timezone,
+        page=page,
+    )
+    items = fx.get("response") or fx.get("results") or []
+    extractor = _EXTRACTORS[q.league]
+    rows: List[GameRow] = []
+    append = rows.append  # bind once; skip the attribute lookup per row
+    for g in items:
+        r = extractor(g)
+        if r.fixture_id is not None:
+            append(r)
+    rows = _ROW_ADAPTER.dump_python(_ROW_ADAPTER.validate_python(rows, from_attributes=True))
+    result = {"count": len(rows), "league": q.league, "date": qdate, "items": rows}
+    await _cache_set(key, result, ttl=60)
+    return result
+
+
 @router.get(
     "/slate",
     summary="Get daily slate (fixtures) for a league",
     description="Returns the day's fixtures with normalized fields.",
 )
-def slate(
+async def slate(
+    request: Request,
+    response: Response,
     q: SlateQuery = Depends(),
     timezone: Optional[str] = Query(None, description="e.g., UTC, America/New_York"),
     page: Optional[int] = Query(None, ge=1, description="Provider paging"),
 ):
-    _ensure_key()
-    qdate = q.date or _date.today().isoformat()
+    result = await _slate_payload(q, timezone=timezone, page=page)
+
+    # Past slates are immutable; today's changes slowly. Let CDNs/browsers
+    # skip us entirely on reloads.
+    _set_cache_control(response, result["date"])
+    if _etag_match(request, response, result):
+        return _not_modified(response)
+    return result
 
-    key = ("slate", q.league, qdate, q.season, q.league_id_override, timezone, page)
-    cached = cache.get(key)
+
+# ---------------- Injuries (unified across sports) ----------------
+# Per-league injuries capability: one dict lookup replaces the guard cascade,
+# and the error objects are built once instead of per rejected request.
+_INJ_RULES: Dict[League, tuple] = {
+    "nba": ("not_supported", HTTPException(status_code=501, detail="Injuries are not provided for NBA/NCAAB by API-SPORTS.")),
+    "ncaab": ("not_supported", HTTPException(status_code=501, detail="Injuries are not provided for NBA/NCAAB by API-SPORTS.")),
+    "nfl": ("requires_any", HTTPException(status_code=422, detail="NFL/NCAAF injuries require at least one of: team or player.")),
+    "ncaaf": ("requires_any", HTTPException(status_code=422, detail="NFL/NCAAF injuries require at least one of: team or player.")),
+    "soccer": ("requires_all", HTTPException(status_code=422, detail="Soccer injuries require league_id_override and season.")),
+}
+async def _injuries_payload(
+    league: League,
+    season: Optional[int] = None,
+    league_id_override: Optional[int] = None,
+    team: Optional[int] = None,
+    player: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Guard, cache, and fetch injuries; shared by /injuries and /batch."""
+    rule, err = _INJ_RULES[league]
+    if rule == "not_supported" or (rule == "requires_any" and not (team or player)) \
+            or (rule == "requires_all" and not (league_id_override and season)):
+        raise err
+
+    key = _qkey("injuries", league=league, season=season, lid=league_id_override, team=team, player=player)
+    cached = await _cache_get(key)
     if cached is not None:
         return cached
 
     client = _client()
-    try:
-        fx = client.fixtures_by_date(
-            league=q.league,
-            date=qdate,
-            season=q.season,
-            league_id=q.league_id_override,
-            timezone=timezone,
-            page=page,
-        )
-        items = fx.get("response") or fx.get("results") or []
-        rows = [_extract_game_row(q.league, g) for g in items]
-        rows = [r for r in rows if r.get("fixture_id") is not None]
-        result = {"count": len(rows), "league": q.league, "date": qdate, "items": rows}
-        cache.set(key, result)
-        return result
-    finally:
-        client.close()
+    kwargs: dict = {}
+    if team is not None:
+        kwargs["team"] = team
+    if player is not None:
+        kwargs["player"] = player
+
+    if league == "soccer":
+        result = await client.injuries(league, league_id=league_id_override, season=season, **kwargs)
+    else:
+        result = await client.injuries(league, **kwargs)
+    await _cache_set(key, result, ttl=60)
+    return result
 
 
-# ---------------- Injuries (unified across sports) ----------------
 @router.get(
     "/injuries",
     summary="Unified injuries",
@@ -193,59 +454,217 @@ def slate(
         "- nba/ncaab: not provided by API-SPORTS"
     ),
 )
-def injuries(
+async def injuries(
     league: League = Query(..., description="nba | nfl | ncaaf | ncaab | soccer"),
     season: Optional[int] = Query(None, description="Required for soccer; ignored by NFL/NCAAF", example=2025),
     league_id_override: Optional[int] = Query(None, description="Soccer competition ID", example=39),
     team: Optional[int] = Query(None, description="Team ID (NFL/NCAAF if no player)", example=15),
     player: Optional[int] = Query(None, description="Player ID (NFL/NCAAF if no team)", example=53),
 ):
-    if league in ("nba", "ncaab"):
-        raise HTTPException(status_code=501, detail="Injuries are not provided for NBA/NCAAB by API-SPORTS.")
-    if league in ("nfl", "ncaaf") and not (team or player):
-        raise HTTPException(status_code=422, detail="NFL/NCAAF injuries require at least one of: team or player.")
-    if league == "soccer" and not (league_id_override and season):
-        raise HTTPException(status_code=422, detail="Soccer injuries require league_id_override and season.")
+    # raw provider JSON: serialize directly and skip the jsonable_encoder walk
+    return ORJSONResponse(await _injuries_payload(league, season, league_id_override, team, player))
 
-    _ensure_key()
 
+# ---------------- Resolve id by teams/date ----------------
+@router.get("/resolve", summary="Resolve a fixture/game id by teams and date")
+async def resolve_endpoint(q: ResolveQuery = Depends()):
     client = _client()
-    try:
-        kwargs: dict = {}
-        if team is not None:
-            kwargs["team"] = team
-        if player is not None:
-            kwargs["player"] = player
+    return await resolve_fixture_id_async(
+        client,
+        league=q.league,
+        date=q.date,
+        home=q.home,
+        away=q.away,
+        league_id_override=q.league_id_override,
+        season=q.season,
+    )
 
-        if league == "soccer":
-            return client.injuries(league, league_id=league_id_override, season=season, **kwargs)
-        return client.injuries(league, **kwargs)
-    finally:
-        client.close()
 
+# ---------------- History (with optional odds) ----------------
+# Above this many per-fixture odds lookups, a soccer window is served by the
+# provider's bulk odds-by-date endpoint and joined locally by fixture id.
+_BULK_ODDS_MIN = 20
+_BULK_ODDS_MAX_DAYS = 14  # past this span, per-fixture fan-out wins again
 
-# ---------------- Resolve id by teams/date ----------------
-@router.get("/resolve", summary="Resolve a fixture/game id by teams and date")
-def resolve_endpoint(q: ResolveQuery = Depends()):
-    _ensure_key()
-    client = _client()
+async def _bulk_odds_index(
+    client: AsyncApiSportsClient,
+    start_date: str,
+    end_date: str,
+    *,
+    bookmaker_id: Optional[int],
+    league_id_override: Optional[int],
+    season: Optional[int],
+) -> Optional[Dict[int, Any]]:
+    """Fetch odds for every fixture in [start, end] via one call per day.
+
+    Returns fixture_id -> raw odds item, or None when the window is too wide
+    or the bulk endpoint fails (callers then fall back to per-fixture pulls).
+    """
     try:
-        return resolve_fixture_id(
-            client,
-            league=q.league,
-            date=q.date,
-            home=q.home,
-            away=q.away,
-            league_id_override=q.league_id_override,
-            season=q.season,
+        d0, d1 = _date.fromisoformat(start_date), _date.fromisoformat(end_date)
+    except ValueError:
+        return None
+    span = (d1 - d0).days + 1
+    if not 0 < span <= _BULK_ODDS_MAX_DAYS:
+        return None
+    days = [(d0 + timedelta(days=i)).isoformat() for i in range(span)]
+
+    async def _day_pages(day: str) -> List[Dict[str, Any]]:
+        # API-Football pages /odds; a busy date's fixtures spill past page 1,
+        # so follow the paging envelope or the join silently drops their odds.
+        first = await client.odds_by_date(
+            "soccer", day,
+            bookmaker=bookmaker_id,
+            league_id=league_id_override,
+            season=season,
         )
-    finally:
-        client.close()
+        paging = first.get("paging") or {}
+        total = _as_int(paging.get("total") or 1) or 1
+        if total <= 1:
+            return [first]
+        rest = await asyncio.gather(*(
+            client.odds_by_date(
+                "soccer", day,
+                bookmaker=bookmaker_id,
+                league_id=league_id_override,
+                season=season,
+                page=p,
+            )
+            for p in range(2, total + 1)
+        ))
+        return [first, *rest]
+
+    try:
+        page_lists = await asyncio.gather(*(_day_pages(day) for day in days))
+    except Exception:
+        return None
+    index: Dict[int, Any] = {}
+    for pages in page_lists:
+        for payload in pages:
+            for it in payload.get("response") or []:
+                fid = (it.get("fixture") or {}).get("id")
+                if fid is not None:
+                    index[_as_int(fid)] = it
+    return index
+
+async def _history_payload(
+    league: League,
+    start_date: str,
+    end_date: str,
+    season: Optional[int] = None,
+    include_odds: bool = False,
+    league_id_override: Optional[int] = None,
+    bookmaker_id: Optional[int] = None,
+    max_odds_lookups: int = 200,
+    timezone: Optional[str] = None,
+    page: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Assemble (and cache) the history payload; shared by /history and /batch."""
+    _check_tz(timezone)
+
+    # Odds-enriched responses must not be served to odds-less callers (and
+    # vice versa), so the key carries the odds knobs too.
+    key = (
+        f"history:{league}:{start_date}:{end_date}:{season}:{league_id_override}"
+        f":{include_odds}:{bookmaker_id}:{max_odds_lookups}:{timezone}:{page}"
+    )
+    cached = await _cache_get(key)
+    if cached is not None:
+        return cached
+
+    client = _client()
+    fx = await client.fixtures_range(
+        league,
+        from_date=start_date,
+        to_date=end_date,
+        season=season,
+        league_id=league_id_override,
+        timezone=timezone,
+        page=page,
+    )
+    items = fx.get("response") or fx.get("results") or []
+
+    out: List[GameRow] = []
+    odds_targets: List[tuple] = []  # (row index, fixture id)
+
+    extractor = _EXTRACTORS[league]
+    scores = _SCORE_EXTRACTORS[league]
+    for g in items:
+        # same extractor as /data/slate (ids already int-cast once), plus scores
+        row = extractor(g)
+        row.home_score, row.away_score = scores(g)
+        if include_odds:
+            fid = row.fixture_id
+            if fid and len(odds_targets) < max_odds_lookups:
+                odds_targets.append((len(out), fid))
+        out.append(row)
+
+    if odds_targets:
+        odds_index = None
+        if league == "soccer" and len(odds_targets) > _BULK_ODDS_MIN:
+            # One /odds?date=... call per day covers every fixture on that day,
+            # so a big window costs D calls instead of N (fixtures >> days).
+            odds_index = await _bulk_odds_index(
+                client, start_date, end_date,
+                bookmaker_id=bookmaker_id,
+                league_id_override=league_id_override,
+                season=season,
+            )
+        loop = asyncio.get_running_loop()
+        if odds_index is not None:
+            def _join_bulk():
+                rows = []
+                for _, fid in odds_targets:
+                    raw = odds_index.get(fid)
+                    # re-wrap the joined item in the provider envelope normalize_odds expects
+                    rows.append(
+                        normalize_odds({"response": [raw]}, preferred_bookmaker_id=bookmaker_id, league=league)
+                        if raw else None
+                    )
+                return rows
+            # Normalizing hundreds of joined payloads is pure CPU; do the whole
+            # loop in the threadpool so the event loop stays responsive.
+            for (idx, _), odds_row in zip(odds_targets, await loop.run_in_executor(None, _join_bulk)):
+                out[idx].odds = odds_row
+        else:
+            # Fan the N odds lookups out concurrently (bounded so we stay inside
+            # the provider's rate limit); HTTP/2 multiplexes them over the shared
+            # connection.
+            sem = asyncio.Semaphore(_ODDS_CONCURRENCY)
+
+            # A fully past range means the odds are final: let the client
+            # memo hold them for the long TTL instead of the live default.
+            odds_cache_ttl = (
+                AsyncApiSportsClient._ODDS_CACHE_TTL_FINAL if end_date < _today_iso() else None
+            )
+
+            async def _fetch_odds(fid: int):
+                async with sem:
+                    try:
+                        raw = await client.odds_for_fixture(league, fid, cache_ttl=odds_cache_ttl)
+                        # offload normalization so it overlaps with the other
+                        # in-flight HTTP requests instead of blocking the loop
+                        return await loop.run_in_executor(
+                            None, partial(normalize_odds, raw, preferred_bookmaker_id=bookmaker_id, league=league)
+                        )
+                    except Exception:
+                        return None
+
+            results = await asyncio.gather(*(_fetch_odds(fid) for _, fid in odds_targets))
+            for (idx, _), odds_row in zip(odds_targets, results):
+                out[idx].odds = odds_row
+
+    result = {"count": len(out), "league": league, "range": [start_date, end_date], "items": out}
+    # past ranges are immutable -> cache for a day; live ranges stay fresh
+    ttl = _CACHE_MAX_AGE_PAST if end_date < _today_iso() else 60
+    await _cache_set(key, result, ttl=ttl)
+    return result
 
 
-# ---------------- History (with optional odds) ----------------
 @router.get("/history")
-def history(
+async def history(
+    request: Request,
+    response: Response,
     league: League,
     start_date: str,
     end_date: str,
@@ -257,106 +676,129 @@ def history(
     timezone: Optional[str] = None,
     page: Optional[int] = None,
 ):
-    _ensure_key()
-
-    client = _client()
-    try:
-        fx = client.fixtures_range(
-            league,
-            from_date=start_date,
-            to_date=end_date,
-            season=season,
-            league_id=league_id_override,
-            timezone=timezone,
-            page=page,
-        )
-        items = fx.get("response") or fx.get("results") or []
-
-        out: List[dict] = []
-        lookups = 0
-
-        for g in items:
-            if league == "soccer":
-                fid = g["fixture"]["id"]
-                dt = g["fixture"]["date"]
-                home = g["teams"]["home"]["name"]
-                away = g["teams"]["away"]["name"]
-                hs = (g.get("goals") or {}).get("home")
-                as_ = (g.get("goals") or {}).get("away")
+    _set_cache_control(response, end_date)
+    result = await _history_payload(
+        league,
+        start_date,
+        end_date,
+        season=season,
+        include_odds=include_odds,
+        league_id_override=league_id_override,
+        bookmaker_id=bookmaker_id,
+        max_odds_lookups=max_odds_lookups,
+        timezone=timezone,
+        page=page,
+    )
+    # Pollers mostly see unchanged windows; a 304 skips streaming entirely.
+    if _etag_match(request, response, result):
+        return _not_modified(response)
+    out = result["items"]
+
+    # Stream the rows instead of buffering one giant JSON body: peak memory
+    # stays O(1 row) on the serialization side and TTFB is immediate.
+    envelope = orjson.dumps(
+        {"count": len(out), "league": league, "range": [start_date, end_date]}
+    )[:-1]  # strip closing brace; items array is appended below
+
+    def _stream():
+        yield envelope + b',"items":['
+        first = True
+        for row in out:
+            if first:
+                first = False
             else:
-                fid = g.get("id") or g.get("game", {}).get("id") or g.get("fixture", {}).get("id")
-                dt = g.get("date") or g.get("game", {}).get("date")
-                teams = g.get("teams") or {}
-                home = (teams.get("home") or {}).get("name") or (g.get("home") or {}).get("name")
-                away = (teams.get("away") or {}).get("name") or (g.get("away") or {}).get("name")
-                sc = g.get("scores") or g.get("score") or {}
-                hsc = sc.get("home"); asc = sc.get("away")
-                hs = (hsc.get("total") if isinstance(hsc, dict) else hsc)
-                as_ = (asc.get("total") if isinstance(asc, dict) else asc)
+                yield b","
+            yield orjson.dumps(row)
+        yield b"]}"
+
+    return StreamingResponse(
+        _stream(),
+        media_type="application/json",
+        # returning a Response directly bypasses the injected one, so carry
+        # the Cache-Control header over explicitly
+        headers={
+            "Cache-Control": response.headers["Cache-Control"],
+            "ETag": response.headers["ETag"],
+        },
+    )
 
-            row = {"fixture_id": fid, "date": dt, "home": home, "away": away, "home_score": hs, "away_score": as_}
 
-            if include_odds and lookups < max_odds_lookups and fid:
-                try:
-                    odds_raw = client.odds_for_fixture(league, int(fid))
-                    row["odds"] = normalize_odds(odds_raw, preferred_bookmaker_id=bookmaker_id)
-                    lookups += 1
-                except Exception:
-                    row["odds"] = None
+# ---------------- Odds (auto-resolve + market/period aliases) ----------------
+# L1 burst coalescing: on game day dozens of clients poll the same fixture
+# within the same second, and even Redis GETs add up. A 200 ms in-process
+# window answers those bursts without leaving the worker.
+_MICRO_TTL = 0.2
+_MICRO_MAX = 2048
+_micro: Dict[str, tuple] = {}
+
+def _micro_get(key: str) -> Optional[Any]:
+    hit = _micro.get(key)
+    if hit is not None and time.monotonic() - hit[0] < _MICRO_TTL:
+        return hit[1]
+    return None
+
+def _micro_put(key: str, value: Any) -> None:
+    if len(_micro) >= _MICRO_MAX:  # entries expire in 200 ms; wholesale reset is fine
+        _micro.clear()
+    _micro[key] = (time.monotonic(), value)
+
+
+async def _odds_payload(q: OddsQuery, market: Optional[str] = None, period: Optional[str] = None) -> Dict[str, Any]:
+    """Resolve, cache, and fetch odds; shared by /odds and /batch."""
+    client = _client()
+    fixture_id, resolved_reason = await _auto_resolve_or_id(
+        client,
+        q.league,
+        q.fixture_id,
+        date=q.date,
+        home=q.home,
+        away=q.away,
+        league_id_override=q.league_id_override,
+        season=q.season,
+    )
 
-            out.append(row)
+    # Friendly alias -> bet id
+    bet_id = q.bet_id
+    if bet_id is None and market:
+        bet_id = resolve_bet_id(q.league, market, period)
+
+    extra: dict = {}
+    if q.bookmaker_id is not None:
+        extra["bookmaker"] = q.bookmaker_id
+    if bet_id is not None:
+        extra["bet"] = bet_id
+
+    # odds move: memoize the normalized shape only briefly
+    key = _qkey("odds", league=q.league, fid=fixture_id, bm=q.bookmaker_id, bet=bet_id, raw=q.raw)
+    micro = _micro_get(key)
+    if micro is not None:
+        return micro
+    cached = await _cache_get(key)
+    if cached is not None:
+        _micro_put(key, cached)
+        return cached
 
-        return {"count": len(out), "league": league, "range": [start_date, end_date], "items": out}
-    finally:
-        client.close()
+    payload = await client.odds_for_fixture(q.league, fixture_id, **extra)
+    if q.raw:
+        result = payload
+    else:
+        result = {
+            "fixture_id": fixture_id,
+            "resolved": resolved_reason,
+            "odds": normalize_odds(payload, preferred_bookmaker_id=q.bookmaker_id, league=q.league),
+        }
+    await _cache_set(key, result, ttl=15)
+    _micro_put(key, result)
+    return result
 
 
-# ---------------- Odds (auto-resolve + market/period aliases) ----------------
 @router.get(
     "/odds",
     summary="Fixture/game odds (raw or normalized)",
     description="Pass a fixture_id or give date+home/away to auto-resolve. Optionally use market alias and period.",
 )
-def odds(q: OddsQuery = Depends(), market: Optional[str] = Query(None), period: Optional[str] = Query(None)):
-    _ensure_key()
-
-    client = _client()
-    try:
-        resolved = _auto_resolve_or_id(
-            client,
-            q.league,
-            q.fixture_id,
-            date=q.date,
-            home=q.home,
-            away=q.away,
-            league_id_override=q.league_id_override,
-            season=q.season,
-        )
-        fixture_id = resolved["fixture_id"]
-        resolved_reason = resolved["resolved"]
-
-        # Friendly alias -> bet id
-        bet_id = q.bet_id
-        if bet_id is None and market:
-            bet_id = resolve_bet_id(q.league, market, period)
-
-        extra: dict = {}
-        if q.bookmaker_id is not None:
-            extra["bookmaker"] = q.bookmaker_id
-        if bet_id is not None:
-            extra["bet"] = bet_id
-
-        payload = client.odds_for_fixture(q.league, int(fixture_id), **extra)
-        if q.raw:
-            return payload
-
-        return {
-            "fixture_id": fixture_id,
-            "resolved": resolved_reason,
-            "odds": normalize_odds(payload, preferred_bookmaker_id=q.bookmaker_id),
-        }
-    finally:
-        client.close()
+async def odds(q: OddsQuery = Depends(), market: Optional[str] = Query(None), period: Optional[str] = Query(None)):
+    return ORJSONResponse(await _odds_payload(q, market, period))
 
 
 # ---------------- Props (auto-resolve; requires market alias) ----------------
@@ -365,7 +807,7 @@ def odds(q: OddsQuery = Depends(), market: Optional[str] = Query(None), period:
     summary="Player props odds (auto-resolve fixture)",
     description="Provide fixture_id or (date + home/away). Use a player prop market alias (e.g., player_points).",
 )
-def props(
+async def props(
     league: League = Query(...),
     market: str = Query(..., description="player prop alias, e.g., player_points, rush_yards"),
     period: Optional[str] = Query(None),
@@ -378,38 +820,40 @@ def props(
     league_id_override: Optional[int] = Query(None),
     raw: bool = Query(False),
 ):
-    validate_league(league)
-    _ensure_key()
+    _LEAGUE_ADAPTER.validate_python(league)
 
     client = _client()
-    try:
-        resolved = _auto_resolve_or_id(
-            client,
-            league,
-            fixture_id,
-            date=date,
-            home=home,
-            away=away,
-            league_id_override=league_id_override,
-            season=season,
-        )
-        fid = resolved["fixture_id"]
+    fid, resolved_reason = await _auto_resolve_or_id(
+        client,
+        league,
+        fixture_id,
+        date=date,
+        home=home,
+        away=away,
+        league_id_override=league_id_override,
+        season=season,
+    )
 
-        bet_id = resolve_bet_id(league, market, period)
-        if bet_id is None:
-            raise HTTPException(status_code=422, detail=f"Unknown market alias '{market}' for league '{league}'.")
+    bet_id = resolve_bet_id(league, market, period)
+    if bet_id is None:
+        raise HTTPException(status_code=422, detail=f"Unknown market alias '{market}' for league '{league}'.")
 
-        payload = client.odds_for_fixture(league, fid, bookmaker=bookmaker_id, bet=bet_id)
-        if raw:
-            return payload
+    key = _qkey("props", league=league, fid=fid, bm=bookmaker_id, bet=bet_id, raw=raw)
+    cached = await _cache_get(key)
+    if cached is not None:
+        return ORJSONResponse(cached)
 
-        return {
+    payload = await client.odds_for_fixture(league, fid, bookmaker=bookmaker_id, bet=bet_id)
+    if raw:
+        result = payload
+    else:
+        result = {
             "fixture_id": fid,
-            "resolved": resolved["resolved"],
-            "odds": normalize_odds(payload, preferred_bookmaker_id=bookmaker_id),
+            "resolved": resolved_reason,
+            "odds": normalize_odds(payload, preferred_bookmaker_id=bookmaker_id, league=league),
         }
-    finally:
-        client.close()
+    await _cache_set(key, result, ttl=15)
+    return ORJSONResponse(result)
 
 
 # ---------------- Stats: game team boxscore (auto-resolve) ----------------
@@ -418,7 +862,7 @@ def props(
     summary="Team stats for a single game (auto-resolve id)",
     description="For nfl/ncaaf/nba/ncaab supply game_id OR date+home+away. Soccer uses fixtures/statistics.",
 )
-def stats_game_teams(
+async def stats_game_teams(
     league: League = Query(..., description="nfl | ncaaf | nba | ncaab | soccer"),
     game_id: Optional[int] = Query(None, description="Game/fixture id"),
     date: Optional[str] = Query(None, description="YYYY-MM-DD (used for resolve)"),
@@ -427,26 +871,27 @@ def stats_game_teams(
     league_id_override: Optional[int] = None,
     season: Optional[int] = None,
 ):
-    validate_league(league)
-    _ensure_key()
+    _LEAGUE_ADAPTER.validate_python(league)
 
     client = _client()
-    try:
-        resolved = _auto_resolve_or_id(
-            client,
-            league,
-            game_id,
-            date=date,
-            home=home,
-            away=away,
-            league_id_override=league_id_override,
-            season=season,
-        )
-        gid = resolved["fixture_id"]
-        data = client.game_team_stats(league, int(gid))
-        return {"fixture_id": gid, "resolved": resolved["resolved"], "data": data}
-    finally:
-        client.close()
+    gid, resolved_reason = await _auto_resolve_or_id(
+        client,
+        league,
+        game_id,
+        date=date,
+        home=home,
+        away=away,
+        league_id_override=league_id_override,
+        season=season,
+    )
+    key = _qkey("stats_game_teams", league=league, gid=gid)
+    cached = await _cache_get(key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    data = await client.game_team_stats(league, gid)
+    result = {"fixture_id": gid, "resolved": resolved_reason, "data": data}
+    await _cache_set(key, result, ttl=300)
+    return ORJSONResponse(result)
 
 
 # ---------------- Stats: game player boxscore (auto-resolve) ----------------
@@ -455,7 +900,7 @@ def stats_game_teams(
     summary="Player stats for a single game (auto-resolve id)",
     description="For nfl/ncaaf/nba/ncaab/soccer supply game_id OR date+home+away.",
 )
-def stats_game_players(
+async def stats_game_players(
     league: League = Query(..., description="nfl | ncaaf | nba | ncaab | soccer"),
     game_id: Optional[int] = Query(None),
     date: Optional[str] = Query(None),
@@ -464,26 +909,27 @@ def stats_game_players(
     league_id_override: Optional[int] = None,
     season: Optional[int] = None,
 ):
-    validate_league(league)
-    _ensure_key()
+    _LEAGUE_ADAPTER.validate_python(league)
 
     client = _client()
-    try:
-        resolved = _auto_resolve_or_id(
-            client,
-            league,
-            game_id,
-            date=date,
-            home=home,
-            away=away,
-            league_id_override=league_id_override,
-            season=season,
-        )
-        gid = resolved["fixture_id"]
-        data = client.game_player_stats(league, int(gid))
-        return {"fixture_id": gid, "resolved": resolved["resolved"], "data": data}
-    finally:
-        client.close()
+    gid, resolved_reason = await _auto_resolve_or_id(
+        client,
+        league,
+        game_id,
+        date=date,
+        home=home,
+        away=away,
+        league_id_override=league_id_override,
+        season=season,
+    )
+    key = _qkey("stats_game_players", league=league, gid=gid)
+    cached = await _cache_get(key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    data = await client.game_player_stats(league, gid)
+    result = {"fixture_id": gid, "resolved": resolved_reason, "data": data}
+    await _cache_set(key, result, ttl=300)
+    return ORJSONResponse(result)
 
 
 # ---------------- Stats: soccer team season ----------------
@@ -492,47 +938,64 @@ def stats_game_players(
     summary="Soccer season team statistics (v3)",
     description="GET /teams/statistics?team=&league=&season=",
 )
-def stats_soccer_team(
+async def stats_soccer_team(
     team_id: int = Query(...),
     league_id: int = Query(...),
     season: int = Query(...),
 ):
-    _ensure_key()
+    key = _qkey("stats_soccer_team", team=team_id, lid=league_id, season=season)
+    cached = await _cache_get(key)
+    if cached is not None:
+        return ORJSONResponse(cached)
     client = _client()
-    try:
-        return client.soccer_team_season_stats(team_id=team_id, league_id=league_id, season=season)
-    finally:
-        client.close()
+    result = await client.soccer_team_season_stats(team_id=team_id, league_id=league_id, season=season)
+    await _cache_set(key, result, ttl=300)
+    return ORJSONResponse(result)
 
 
 # ---------------- Windowed stats (batch helpers for features) ----------------
+_IDS_RE = re.compile(r"\d+")
+_MAX_WINDOW_IDS = 500  # keep downstream batch calls bounded
+_ERR_TOO_MANY_IDS = HTTPException(status_code=422, detail=f"Too many game_ids (max {_MAX_WINDOW_IDS}).")
+
+def _parse_ids(game_ids: str) -> List[int]:
+    """Parse dash-separated ids in one regex pass (C) instead of a per-token
+    strip/isdigit/int walk that builds two throwaway strings per id."""
+    ids = list(map(int, _IDS_RE.findall(game_ids)))
+    if len(ids) > _MAX_WINDOW_IDS:
+        raise _ERR_TOO_MANY_IDS
+    return ids
+
+
 @router.get(
     "/stats/window/teams",
     summary="Windowed per-game team statistics (v1 families only)",
     description="Collect per-game team stats for multiple games by ids (dash-separated).",
 )
-def stats_window_teams(
+async def stats_window_teams(
     league: League = Query(..., description="nfl | ncaaf | nba | ncaab"),
     game_ids: Optional[str] = Query(None, description='Dash-separated ids, e.g. "123-456-789"'),
 ):
-    validate_league(league)
+    _LEAGUE_ADAPTER.validate_python(league)
     if league == "soccer":
-        raise HTTPException(status_code=422, detail="Use /stats/soccer/team for soccer contexts.")
-    _ensure_key()
+        raise _ERR_SOCCER_WINDOW
 
     if not game_ids:
-        raise HTTPException(status_code=422, detail="Provide game_ids (dash-separated).")
+        raise _ERR_NEED_GAME_IDS
 
-    ids = [int(x) for x in game_ids.split("-") if x.strip().isdigit()]
+    ids = _parse_ids(game_ids)
     if not ids:
-        raise HTTPException(status_code=422, detail="No valid ids in game_ids.")
+        raise _ERR_NO_IDS
 
+    key = _qkey("stats_window_teams", league=league, ids=game_ids)
+    cached = await _cache_get(key)
+    if cached is not None:
+        return ORJSONResponse(cached)
     client = _client()
-    try:
-        data = client.game_team_stats_batch(league, ids)
-        return {"league": league, "count": len(ids), "ids": ids, "data": data}
-    finally:
-        client.close()
+    data = await client.game_team_stats_batch(league, ids)
+    result = {"league": league, "count": len(ids), "ids": ids, "data": data}
+    await _cache_set(key, result, ttl=300)
+    return ORJSONResponse(result)
 
 
 @router.get(
@@ -540,33 +1003,35 @@ def stats_window_teams(
     summary="Windowed per-game player statistics (v1 families only)",
     description="Collect per-game player stats for multiple games by ids (dash-separated).",
 )
-def stats_window_players(
+async def stats_window_players(
     league: League = Query(..., description="nfl | ncaaf | nba | ncaab"),
     game_ids: Optional[str] = Query(None, description='Dash-separated ids, e.g. "123-456-789"'),
 ):
-    validate_league(league)
+    _LEAGUE_ADAPTER.validate_python(league)
     if league == "soccer":
-        raise HTTPException(status_code=422, detail="Use /stats/soccer/team for soccer contexts.")
-    _ensure_key()
+        raise _ERR_SOCCER_WINDOW
 
     if not game_ids:
-        raise HTTPException(status_code=422, detail="Provide game_ids (dash-separated).")
+        raise _ERR_NEED_GAME_IDS
 
-    ids = [int(x) for x in game_ids.split("-") if x.strip().isdigit()]
+    ids = _parse_ids(game_ids)
     if not ids:
-        raise HTTPException(status_code=422, detail="No valid ids in game_ids.")
+        raise _ERR_NO_IDS
 
+    key = _qkey("stats_window_players", league=league, ids=game_ids)
+    cached = await _cache_get(key)
+    if cached is not None:
+        return ORJSONResponse(cached)
     client = _client()
-    try:
-        data = client.game_player_stats_batch(league, ids)
-        return {"league": league, "count": len(ids), "ids": ids, "data": data}
-    finally:
-        client.close()
+    data = await client.game_player_stats_batch(league, ids)
+    result = {"league": league, "count": len(ids), "ids": ids, "data": data}
+    await _cache_set(key, result, ttl=300)
+    return ORJSONResponse(result)
 
 
 # ---------------- Derived Ratings (optional) ----------------
 @router.get("/ratings", summary="Computed team offensive/defensive ratings")
-def ratings(
+async def ratings(
     league: League = Query(...),
     team_name: str = Query(..., description="Exact team name as appears in API-Sports"),
     start_date: str = Query(...),
@@ -579,25 +1044,86 @@ def ratings(
 ):
     if compute_efficiency is None:
         raise HTTPException(status_code=501, detail="ratings service not available in this build.")
-    _ensure_key()
+
+    key = _qkey(
+        "ratings", league=league, team=team_name, start=start_date, end=end_date,
+        season=season, lid=league_id_override, window=window, tz=timezone, page=page,
+    )
+    cached = await _cache_get(key)
+    if cached is not None:
+        return cached
 
     client = _client()
+    fx = await client.fixtures_range(
+        league=league,
+        from_date=start_date,
+        to_date=end_date,
+        season=season,
+        league_id=league_id_override,
+        timezone=timezone,
+        page=page,
+    )
+    items = (fx.get("response") or fx.get("results") or [])[-window:]
+    result = {
+        "league": league,
+        "team": team_name,
+        "window": len(items),
+        "ratings": compute_efficiency(items, team_name),  # type: ignore[misc]
+    }
+    await _cache_set(key, result, ttl=3600)
+    return result
+
+# ---------------- Batch (fan out several reads in one call) ----------------
+_BATCH_MAX = 20  # keep fan-out bounded per request
+
+class BatchItem(BaseModel):
+    route: Literal["slate", "injuries", "resolve", "odds", "history"]
+    params: Dict[str, Any] = Field(default_factory=dict)
+
+def _split_params(model_cls, params: Dict[str, Any]):
+    """Partition raw params into the route's query model + leftover kwargs."""
+    fields = model_cls.model_fields
+    core = {k: v for k, v in params.items() if k in fields}
+    rest = {k: v for k, v in params.items() if k not in fields}
+    return model_cls(**core), rest
+
+async def _dispatch_batch_item(item: BatchItem) -> Dict[str, Any]:
+    p = item.params
     try:
-        fx = client.fixtures_range(
-            league=league,
-            from_date=start_date,
-            to_date=end_date,
-            season=season,
-            league_id=league_id_override,
-            timezone=timezone,
-            page=page,
-        )
-        items = (fx.get("response") or fx.get("results") or [])[-window:]
-        return {
-            "league": league,
-            "team": team_name,
-            "window": len(items),
-            "ratings": compute_efficiency(items, team_name),  # type: ignore[misc]
-        }
-    finally:
-        client.close()
+        if item.route == "slate":
+            q, rest = _split_params(SlateQuery, p)
+            data = await _slate_payload(q, timezone=rest.get("timezone"), page=rest.get("page"))
+        elif item.route == "injuries":
+            data = await _injuries_payload(**p)
+        elif item.route == "resolve":
+            q, _ = _split_params(ResolveQuery, p)
+            data = await resolve_endpoint(q)
+        elif item.route == "odds":
+            q, rest = _split_params(OddsQuery, p)
+            data = await _odds_payload(q, market=rest.get("market"), period=rest.get("period"))
+        else:  # history
+            data = await _history_payload(**p)
+        return {"ok": True, "data": data}
+    except ValidationError as e:
+        return {"ok": False, "status": 422, "detail": e.errors()}
+    except HTTPException as e:
+        return {"ok": False, "status": e.status_code, "detail": e.detail}
+    except Exception as e:  # one bad item must not sink its siblings
+        return {"ok": False, "status": 500, "detail": str(e)}
+
+@router.post(
+    "/batch",
+    summary="Run several data reads in one HTTP call",
+    description=(
+        "Accepts [{route, params}, ...] and dispatches the items concurrently, "
+        "returning results in request order. Saves one round trip per item "
+        "for front-ends that need slate + injuries + odds together."
+    ),
+)
+async def batch(items: List[BatchItem]):
+    if not items:
+        raise HTTPException(status_code=422, detail="Provide at least one batch item.")
+    if len(items) > _BATCH_MAX:
+        raise HTTPException(status_code=422, detail=f"Batch size is limited to {_BATCH_MAX} items.")
+    results = await asyncio.gather(*(_dispatch_batch_item(i) for i in items))
+    return {"count": len(results), "results": results}
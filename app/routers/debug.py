@@ -1,37 +1,36 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from ..clients.apisports import ApiSportsClient, League
-from ..core.config import get_settings
+from ..deps import get_client
 
 router = APIRouter(prefix="/data/debug", tags=["debug"])
 
-def _client() -> ApiSportsClient:
-    return ApiSportsClient(api_key=get_settings().apisports_key)
-
 @router.get("/bookmakers", summary="List bookmakers present for a fixture")
-def bookmakers(league: League, fixture_id: int = Query(..., description="Game/fixture id")):
-    c = _client()
-    try:
-        raw = c.odds_for_fixture(league, fixture_id)
-    finally:
-        c.close()
+def bookmakers(
+    league: League,
+    fixture_id: int = Query(..., description="Game/fixture id"),
+    c: ApiSportsClient = Depends(get_client),
+):
+    raw = c.odds_for_fixture(league, fixture_id)
     books = (raw or {}).get("response", [])
     if not books:
-        return {"fixture_id": fixture_id, "bookmakers": []}
+        return ORJSONResponse({"fixture_id": fixture_id, "bookmakers": []})
     out = [{"id": b.get("id"), "name": b.get("name")} for b in books[0].get("bookmakers", [])]
-    return {"fixture_id": fixture_id, "bookmakers": out}
+    return ORJSONResponse({"fixture_id": fixture_id, "bookmakers": out})
 
 @router.get("/markets", summary="List markets (bets) available for a fixture & bookmaker")
-def markets(league: League, fixture_id: int, bookmaker_id: int):
-    c = _client()
-    try:
-        raw = c.odds_for_fixture(league, fixture_id)
-    finally:
-        c.close()
+def markets(
+    league: League,
+    fixture_id: int,
+    bookmaker_id: int,
+    c: ApiSportsClient = Depends(get_client),
+):
+    raw = c.odds_for_fixture(league, fixture_id)
     resp = (raw or {}).get("response", [])
     if not resp:
-        return {"fixture_id": fixture_id, "bookmaker_id": bookmaker_id, "bets": []}
+        return ORJSONResponse({"fixture_id": fixture_id, "bookmaker_id": bookmaker_id, "bets": []})
     for bk in resp[0].get("bookmakers", []):
         if bk.get("id") == bookmaker_id:
             bets = [{"id": b.get("id"), "name": b.get("name")} for b in bk.get("bets", [])]
-            return {"fixture_id": fixture_id, "bookmaker_id": bookmaker_id, "bets": bets}
-    return {"fixture_id": fixture_id, "bookmaker_id": bookmaker_id, "bets": []}
+            return ORJSONResponse({"fixture_id": fixture_id, "bookmaker_id": bookmaker_id, "bets": bets})
+    return ORJSONResponse({"fixture_id": fixture_id, "bookmaker_id": bookmaker_id, "bets": []})
@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 from typing import Optional
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
-from ..clients.apisports import ApiSportsClient, League
-from ..core.config import get_settings
+from ..clients.apisports import AsyncApiSportsClient, League
+from ..deps import get_async_client
 from ..services.odds import normalize_odds
-from ..services.resolve import resolve_fixture_id
+from ..services.resolve import resolve_fixture_id_async
 
 # If you already have a picker, import it. If not, we’ll return odds and an empty list of picks.
 _HAS_PICKER = True
@@ -21,15 +22,8 @@ except Exception:
 router = APIRouter(tags=["picks"])
 
 
-def _client() -> ApiSportsClient:
-    settings = get_settings()
-    if not settings.apisports_key:
-        raise HTTPException(status_code=500, detail="APISPORTS_KEY missing")
-    return ApiSportsClient(api_key=settings.apisports_key)
-
-
 @router.get("/picks", summary="Compute picks (auto-resolves fixture when needed)")
-def picks(
+async def picks(
     league: League = Query(..., description="nba | nfl | ncaaf | ncaab | soccer"),
     # Path A: pass the game/fixture id directly (soccer fixture id OR AF game id)
     fixture_id: Optional[int] = Query(
@@ -54,77 +48,75 @@ def picks(
     raw_odds: bool = Query(
         False, description="If true, returns provider odds without normalization"
     ),
+    client: AsyncApiSportsClient = Depends(get_async_client),
 ):
     """
     One call to:
     1) resolve (if needed) -> 2) fetch odds -> 3) normalize -> 4) compute picks (if picker available).
     """
-    client = _client()
-    try:
-        resolved_note = None
+    resolved_note = None
 
-        # ---------- 1) Resolve if user didn't provide fixture_id ----------
-        if fixture_id is None:
-            if not date or not (home or away):
-                raise HTTPException(
-                    status_code=422,
-                    detail="Provide fixture_id OR (date and at least one of home/away) for auto-resolve.",
-                )
-            res = resolve_fixture_id(
-                client,
-                league=league,
-                date=date,
-                home=home,
-                away=away,
-                league_id_override=league_id_override,
-                season=season,
+    # ---------- 1) Resolve if user didn't provide fixture_id ----------
+    if fixture_id is None:
+        if not date or not (home or away):
+            raise HTTPException(
+                status_code=422,
+                detail="Provide fixture_id OR (date and at least one of home/away) for auto-resolve.",
+            )
+        res = await resolve_fixture_id_async(
+            client,
+            league=league,
+            date=date,
+            home=home,
+            away=away,
+            league_id_override=league_id_override,
+            season=season,
+        )
+        fixture_id = res.get("fixture_id")
+        resolved_note = res.get("picked_reason")
+        if not fixture_id:
+            # Surface candidates to your GPT/app for quick user confirmation
+            raise HTTPException(
+                status_code=409,
+                detail={
+                    "message": "Could not confidently resolve fixture; please confirm one of the candidates.",
+                    "candidates": res.get("candidates", []),
+                },
             )
-            fixture_id = res.get("fixture_id")
-            resolved_note = res.get("picked_reason")
-            if not fixture_id:
-                # Surface candidates to your GPT/app for quick user confirmation
-                raise HTTPException(
-                    status_code=409,
-                    detail={
-                        "message": "Could not confidently resolve fixture; please confirm one of the candidates.",
-                        "candidates": res.get("candidates", []),
-                    },
-                )
 
-        # ---------- 2) Fetch odds ----------
-        extra = {}
-        if bookmaker_id is not None:
-            extra["bookmaker"] = bookmaker_id
-        if bet_id is not None:
-            extra["bet"] = bet_id
+    # ---------- 2) Fetch odds ----------
+    extra = {}
+    if bookmaker_id is not None:
+        extra["bookmaker"] = bookmaker_id
+    if bet_id is not None:
+        extra["bet"] = bet_id
 
-        odds_payload = client.odds_for_fixture(league, int(fixture_id), **extra)
+    odds_payload = await client.odds_for_fixture(league, fixture_id, **extra)
 
-        # ---------- 3) Normalize (unless raw requested) ----------
-        if raw_odds:
-            normalized = None
-        else:
-            normalized = normalize_odds(
-                odds_payload, preferred_bookmaker_id=bookmaker_id
-            )
+    # ---------- 3) Normalize (unless raw requested) ----------
+    if raw_odds:
+        normalized = None
+    else:
+        normalized = normalize_odds(
+            odds_payload, preferred_bookmaker_id=bookmaker_id, league=league
+        )
 
-        # ---------- 4) Compute picks (if picker exists) ----------
-        if not _HAS_PICKER or normalized is None:
-            picks_out = []
-        else:
-            # Your picker should accept normalized odds and return a list of pick dicts.
-            # If your function name/signature differs, update the import/line above.
-            picks_out = _compute_picks(
-                league=league, normalized_odds=normalized, bookmaker_id=bookmaker_id
-            )
+    # ---------- 4) Compute picks (if picker exists) ----------
+    if not _HAS_PICKER or normalized is None:
+        picks_out = []
+    else:
+        # Your picker should accept normalized odds and return a list of pick dicts.
+        # If your function name/signature differs, update the import/line above.
+        picks_out = _compute_picks(
+            league=league, normalized_odds=normalized, bookmaker_id=bookmaker_id
+        )
 
-        return {
-            "fixture_id": fixture_id,
-            "resolved": resolved_note,
-            "league": league,
-            "odds": odds_payload if raw_odds else normalized,
-            "picks": picks_out,
-        }
+    # serialize directly; raw odds payloads are large and the encoder walk isn't free
+    return ORJSONResponse({
+        "fixture_id": fixture_id,
+        "resolved": resolved_note,
+        "league": league,
+        "odds": odds_payload if raw_odds else normalized,
+        "picks": picks_out,
+    })
 
-    finally:
-        client.close()
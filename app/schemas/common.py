@@ -12,6 +12,14 @@ class Odds(BaseModel):
     spread: float | None = None
     total: float | None = None
 
+class FixtureRow(BaseModel):
+    """Normalized slate row (one pass of TypeAdapter validation, not per-item)."""
+    fixture_id: int
+    date: Optional[str] = None
+    home: Optional[str] = None
+    away: Optional[str] = None
+    venue_city: Optional[str] = None
+
 class Fixture(BaseModel):
     fixture_id: int
     league: League
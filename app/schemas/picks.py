@@ -1,8 +1,12 @@
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from typing import Optional, List
 from .common import League, BetType, Pick
 
+# Batch-validate whole pick lists in one pydantic-core pass instead of
+# constructing models one at a time in the pipeline loop.
+PICKS_ADAPTER: TypeAdapter[List[Pick]] = TypeAdapter(List[Pick])
+
 class PicksRequest(BaseModel):
     league: League
     date: Optional[str] = None
@@ -1,30 +1,60 @@
 # app/services/cache.py
 from __future__ import annotations
 
+import threading
 import time
-from typing import Any, Callable, Tuple, Dict
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
 
 class TTLCache:
+    # bound once: skips the module-attribute lookup on every get/set, and
+    # monotonic means an NTP step can't mass-expire (or freeze) the cache
+    _now = time.monotonic
+
     def __init__(self, ttl_seconds: int = 120, maxsize: int = 512):
         self.ttl = ttl_seconds
         self.maxsize = maxsize
-        self._data: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        # Insertion-ordered so eviction can drop the least-recently-used entry
+        # instead of clearing everything and collapsing the hit rate to zero.
+        # Entries are (expires_at, value): get() is a single compare.
+        self._data: OrderedDict[Tuple[Any, ...], Tuple[float, Any]] = OrderedDict()
+        self._sets = 0
+        # The module-level instances are shared by sync routes running on
+        # FastAPI's threadpool: without the lock, an eviction between another
+        # thread's get() hit and its move_to_end raises KeyError, and the
+        # periodic sweep can mutate mid-iteration. Same race, same fix as the
+        # normalize_odds memo.
+        self._lock = threading.Lock()
 
     def get(self, key: Tuple[Any, ...]):
-        now = time.time()
-        v = self._data.get(key)
-        if not v:
-            return None
-        ts, val = v
-        if now - ts > self.ttl:
-            self._data.pop(key, None)
-            return None
-        return val
+        with self._lock:
+            v = self._data.get(key)
+            if v is None:  # entries are (expires_at, value) tuples, never falsy
+                return None
+            expires_at, val = v
+            if expires_at < TTLCache._now():
+                self._data.pop(key, None)
+                return None
+            self._data.move_to_end(key)  # promote: recently used survives eviction
+            return val
 
-    def set(self, key: Tuple[Any, ...], value: Any):
-        if len(self._data) >= self.maxsize:
-            # naive eviction: clear all
-            self._data.clear()
-        self._data[key] = (time.time(), value)
+    def set(self, key: Tuple[Any, ...], value: Any, ttl: Optional[int] = None):
+        with self._lock:
+            while len(self._data) >= self.maxsize:
+                self._data.popitem(last=False)
+            now = TTLCache._now()
+            # per-entry override so callers with volatility-matched TTLs (odds at
+            # 15s, slates at 60s, ...) aren't flattened to the instance default
+            self._data[key] = (now + (ttl or self.ttl), value)
+            # Occasional sweep so one-shot keys don't linger until eviction.
+            self._sets += 1
+            if self._sets % 128 == 0:
+                stale = [k for k, (exp, _) in self._data.items() if exp < now]
+                for k in stale:
+                    del self._data[k]
 
 cache = TTLCache()
+
+# Picks/backtest pipeline caches: slates change slowly, odds move faster.
+slate_cache = TTLCache(ttl_seconds=60)
+odds_cache = TTLCache(ttl_seconds=30)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from typing import Optional, Dict, Any
+import functools
 import json
 import importlib
 import pkgutil
@@ -24,7 +25,7 @@ import pathlib
 #   }
 # -----------------------------------------------------------------------------
 
-_MAP: Dict[str, Any] | None = None
+__all__ = ["resolve_bet_id", "list_markets"]
 
 def _load_from_module() -> Dict[str, Any] | None:
     try:
@@ -79,11 +80,14 @@ def _load_from_envfile() -> Dict[str, Any] | None:
         return None
 
 def _normalize_map(m: Dict[str, Any]) -> Dict[str, Any]:
-    # Ensure consistent keys, lowercased leagues/aliases/periods.
+    # Ensure consistent keys, lowercased leagues/aliases/periods. Alongside
+    # the bets table, build an inverted (alias, period) -> bet_id index so
+    # resolve_bet_id is one dict probe instead of a scan over every bet.
     out: Dict[str, Any] = {}
     for league, payload in (m or {}).items():
         bets = (payload or {}).get("bets") or {}
         nbets: Dict[str, Any] = {}
+        idx: Dict[tuple, int] = {}
         for bid, meta in bets.items():
             try:
                 bid_int = int(bid)
@@ -93,14 +97,16 @@ def _normalize_map(m: Dict[str, Any]) -> Dict[str, Any]:
             alias = (meta.get("alias") or "").strip().lower()
             periods = [str(p).strip().lower() for p in (meta.get("periods") or ["game"])]
             nbets[str(bid_int)] = {"alias": alias, "periods": periods}
-        out[league.strip().lower()] = {"bets": nbets}
+            for period in periods:
+                idx.setdefault((alias, period), bid_int)
+            idx.setdefault((alias, None), bid_int)  # alias-only fallback
+        out[league.strip().lower()] = {"bets": nbets, "_index": idx}
     return out
 
+@functools.cache
 def _load_map() -> Dict[str, Any]:
-    global _MAP
-    if _MAP is not None:
-        return _MAP
-
+    # functools.cache is computed-once under a lock, unlike the old global
+    # sentinel which could race in FastAPI's threadpool on first request.
     m = _load_from_module()
     if m is None:
         m = _load_from_json_resource()
@@ -108,9 +114,7 @@ def _load_map() -> Dict[str, Any]:
         m = _load_from_envfile()
     if m is None:
         m = {}
-
-    _MAP = _normalize_map(m)
-    return _MAP
+    return _normalize_map(m)
 
 # -----------------------------------------------------------------------------
 # Public resolver
@@ -132,32 +136,21 @@ def resolve_bet_id(league: str, market_alias: Optional[str], period: Optional[st
     period_key = (period or "game").strip().lower()
 
     MAP = _load_map()  # lazy load; safe if file/module missing
-    sport = MAP.get(league_key) or {}
-    bets = (sport.get("bets") or {})
-
-    # 1) exact alias + period match
-    for bid_str, meta in bets.items():
-        alias = (meta.get("alias") or "")
-        periods = meta.get("periods") or ["game"]
-        if alias == alias_key and period_key in periods:
-            try:
-                return int(bid_str)
-            except Exception:
-                continue
+    idx = (MAP.get(league_key) or {}).get("_index") or {}
 
-    # 2) fallback: alias only
-    for bid_str, meta in bets.items():
-        alias = (meta.get("alias") or "")
-        if alias == alias_key:
-            try:
-                return int(bid_str)
-            except Exception:
-                continue
-
-    return None
+    # exact alias + period match, then alias-only fallback — both O(1)
+    bid = idx.get((alias_key, period_key))
+    if bid is not None:
+        return bid
+    return idx.get((alias_key, None))
 
 # Optional helper: list known markets for debugging
 def list_markets(league: str) -> Dict[str, Any]:
     MAP = _load_map()
     league_key = (league or "").strip().lower()
-    return MAP.get(league_key, {})
+    # expose only the bets table; _index has tuple keys and is an internal detail
+    return {"bets": (MAP.get(league_key) or {}).get("bets") or {}}
+
+# Warm the map at import so the load/normalize cost lands at startup,
+# not in the first request's latency.
+_load_map()
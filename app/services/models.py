@@ -1,5 +1,5 @@
 
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from .feature_store import ml_winprob
 
 def fair_ml_prob(home_off: float, home_def: float, away_off: float, away_def: float) -> float:
@@ -26,3 +26,20 @@ def american_to_prob(price: float) -> float:
 def prob_to_american(p: float) -> int:
     if p <= 0 or p >= 1: return 0
     return int(round(100 * p / (1 - p))) if p < 0.5 else int(round(-100 * (1 - p) / p))
+
+def american_to_prob_batch(prices: List[float]) -> List[Optional[float]]:
+    """Batch form for slate-wide scoring: invalid prices become None
+    instead of raising, so one bad book line can't abort the pass."""
+    out: List[Optional[float]] = []
+    append = out.append
+    for price in prices:
+        if price >= 100:
+            append(100 / (price + 100))
+        elif price <= -100:
+            append((-price) / (-price + 100))
+        else:
+            append(None)
+    return out
+
+def prob_to_american_batch(probs: List[float]) -> List[int]:
+    return [prob_to_american(p) for p in probs]
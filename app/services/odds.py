@@ -1,19 +1,63 @@
 # app/services/odds.py
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
 from typing import Any, Dict, Optional, List, Tuple
-import re
 
 # Optional: if you later want id-based mapping or name hints, these are available.
 # The module works fine without them present (we guard imports).
 try:
-    from ..spec.apisports_map import MAP as _MAP, NAME_FALLBACKS as _NAME_FALLBACKS, PERIOD_HINTS as _PERIOD_HINTS, PROP_FALLBACKS as _PROP_FALLBACKS
+    from ..spec.apisports_map import (
+        MAP as _MAP,
+        NAME_FALLBACKS as _NAME_FALLBACKS,
+        NAME_INDEX as _NAME_INDEX,
+        PERIOD_HINTS as _PERIOD_HINTS,
+        PERIOD_INDEX as _PERIOD_INDEX,
+        PROP_FALLBACKS as _PROP_FALLBACKS,
+    )
 except Exception:  # pragma: no cover - run-time optional
     _MAP = {}                 # type: ignore[assignment]
     _NAME_FALLBACKS = {}      # type: ignore[assignment]
+    _NAME_INDEX = {}          # type: ignore[assignment]
     _PERIOD_HINTS = {}        # type: ignore[assignment]
+    _PERIOD_INDEX = {}        # type: ignore[assignment]
     _PROP_FALLBACKS = {}      # type: ignore[assignment]
 
+# Hint tables lowercased once at import; the detection helpers compare
+# against these instead of re-lowercasing every hint for every bet.
+def _flat_alias_table(bets: Dict[str, Any]) -> Dict[Any, str]:
+    # Key each alias under both the map's string id and its int form:
+    # provider payloads carry integer bet ids, so the hot probe can use the
+    # raw id without a str() conversion per bet.
+    out: Dict[Any, str] = {}
+    for bid, meta in bets.items():
+        if isinstance(meta, dict) and meta.get("alias"):
+            out[bid] = meta["alias"]
+            try:
+                out[int(bid)] = meta["alias"]
+            except (TypeError, ValueError):
+                pass
+    return out
+
+# Partial evaluation of the market map: a flat {bet_id: alias} dict per
+# league, built once at import, so classifying a known bet id is a single
+# probe with no per-call indirection through the nested map shape.
+_ALIAS_BY_LEAGUE: Dict[str, Dict[Any, str]] = {
+    lg: _flat_alias_table(conf.get("bets") or {}) for lg, conf in (_MAP or {}).items()
+}
+
+# Flattened to (needle, result) pairs so detection is a single flat loop of
+# `needle in name` checks — sourced from the spec's inverted indexes, which
+# are already lowercased and deduplicated.
+_NAME_NEEDLES = tuple(_NAME_INDEX.items())
+_PERIOD_NEEDLES = tuple(_PERIOD_INDEX.items())
+_PROP_FALLBACKS_LC = {p: tuple(h.lower() for h in hs) for p, hs in (_PROP_FALLBACKS or {}).items()}
+
+
+__all__ = ["normalize_odds"]
+
 
 # -------------------------------
 # Public API
@@ -21,6 +65,7 @@ except Exception:  # pragma: no cover - run-time optional
 def normalize_odds(
     payload: Dict[str, Any],
     preferred_bookmaker_id: Optional[int] = None,
+    league: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Normalize API-Sports odds into a compact, league-agnostic shape:
@@ -41,6 +86,7 @@ def normalize_odds(
     Notes:
       • We select one bookmaker: preferred_bookmaker_id if available, else the first with bets.
       • We classify by id (if map present) and by market names as fallback.
+        Passing `league` narrows the id lookup to that league's map entry.
       • American odds are returned as numeric (e.g., -110.0, 100.0).
     """
     # Default scaffold
@@ -58,6 +104,19 @@ def normalize_odds(
         return empty
 
     node = resp[0] or {}
+
+    # normalize_odds is pure in its inputs, and callers (history bulk joins,
+    # retries, report paths) can hand us the same payload repeatedly. When the
+    # payload carries enough identity (fixture id + update stamp) to make a
+    # safe fingerprint, memoize the normalized shape.
+    cache_key = _norm_cache_key(node, preferred_bookmaker_id, league)
+    if cache_key is not None:
+        with _NORM_CACHE_LOCK:
+            hit = _NORM_CACHE.get(cache_key)
+            if hit is not None:
+                _NORM_CACHE.move_to_end(cache_key)
+                return hit
+
     books: List[dict] = node.get("bookmakers") or []
 
     book = _pick_bookmaker(books, preferred_bookmaker_id)
@@ -65,118 +124,259 @@ def normalize_odds(
         return empty
 
     out = dict(empty)  # copy
+    # defaultdict during assembly: prop attachment indexes straight into the
+    # bucket instead of a setdefault probe per outcome (flattened on return)
+    out["props"] = defaultdict(list)
+
+    # When the map carries no prop or period hints, the only things left to
+    # find are the three game-level core markets — once they are filled we can
+    # stop scanning the (often long) remainder of the bookmaker's bet list.
+    may_exit_early = not _PROP_FALLBACKS and not _PERIOD_HINTS
+    core_filled = 0
+
+    # Resolve the caller's league to its flat id->alias table once; every bet
+    # in the payload then probes one dict instead of walking the nested map.
+    league_bets = _ALIAS_BY_LEAGUE.get((league or "").strip().lower()) if league else None
 
     for bet in (book.get("bets") or []):
-        alias = _detect_alias(bet) or ""  # "moneyline" | "spread" | "total" | ""
-        period = _detect_period(bet)
+        # one pass: lowercase the bet name once for alias + period + props
+        alias, period, name_lc = _classify(bet, league_bets)
 
-        # Normalize core markets
+        # Normalize core markets (first qualifying bet wins)
         if alias == "moneyline":
-            ml = _map_moneyline(bet)
-            if ml is not None:
-                out["moneyline"] = ml
+            if out["moneyline"] is None:
+                ml = _map_moneyline(bet)
+                if ml is not None:
+                    out["moneyline"] = ml
+                    core_filled += 1
 
         elif alias == "spread":
-            sp = _map_spread(bet)
-            if sp is not None:
-                # (spreads are always game-level in our structure)
-                out["spread"] = sp
+            if out["spread"] is None:
+                sp = _map_spread(bet)
+                if sp is not None:
+                    # (spreads are always game-level in our structure)
+                    out["spread"] = sp
+                    core_filled += 1
 
         elif alias == "total":
             tot = _map_total(bet)
             if tot is not None:
                 if period == "game":
-                    out["total"] = tot
+                    if out["total"] is None:
+                        out["total"] = tot
+                        core_filled += 1
                 elif period in ("1h", "2h"):
-                    out["half_total"] = tot
+                    if out["half_total"] is None:
+                        out["half_total"] = tot
                 elif period.endswith("q"):
-                    out["quarter_total"] = tot
+                    if out["quarter_total"] is None:
+                        out["quarter_total"] = tot
 
         else:
             # Try props via name-based classification (if hints provided)
-            _maybe_attach_prop(out, bet)
+            _maybe_attach_prop(out, bet, name_lc)
 
+        if may_exit_early and core_filled == 3:
+            break
+
+    out["props"] = dict(out["props"])  # restore the plain-dict external shape
+    if cache_key is not None:
+        with _NORM_CACHE_LOCK:
+            while len(_NORM_CACHE) >= _NORM_CACHE_MAX:
+                _NORM_CACHE.popitem(last=False)
+            _NORM_CACHE[cache_key] = out
     return out
 
 
 # -------------------------------
 # Internals (helpers)
 # -------------------------------
+_NORM_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_NORM_CACHE_MAX = 1024
+# normalize_odds runs both on the event loop and inside executor threads
+# (history offloads), so the get/move_to_end/evict sequences must not
+# interleave: an eviction between another thread's get and move_to_end
+# would raise KeyError. The critical sections are a few dict ops, so the
+# lock is uncontended-cheap.
+_NORM_CACHE_LOCK = threading.Lock()
+
+
+def _norm_cache_key(node: Dict[str, Any], preferred_bookmaker_id: Optional[int], league: Optional[str]) -> Optional[tuple]:
+    """Fingerprint a payload for the normalize cache.
+
+    Requires a fixture/game id plus an update stamp — without the stamp we
+    can't tell a refreshed payload from a stale one, so we skip caching.
+    """
+    fx = node.get("fixture") or node.get("game")
+    fid = fx.get("id") if isinstance(fx, dict) else node.get("id")
+    if fid is None:
+        return None
+    upd = node.get("update") or node.get("updated") or node.get("update_time")
+    if not upd:
+        return None
+    return (fid, preferred_bookmaker_id, upd, league)
+
+
 def _pick_bookmaker(bookmakers: List[dict], preferred_id: Optional[int]) -> Optional[dict]:
     if not bookmakers:
         return None
+    # One pass: note the preferred-id hit and the first book with bets
+    # simultaneously instead of re-walking the list per criterion.
+    first_with_bets = None
     if preferred_id is not None:
+        want = int(preferred_id)
+        want_s = str(want)
         for bm in bookmakers:
-            try:
-                if int(bm.get("id")) == int(preferred_id):
-                    return bm
-            except Exception:
-                pass
-    for bm in bookmakers:
-        if bm.get("bets"):
-            return bm
-    return bookmakers[0] if bookmakers else None
+            # cheap type guards instead of a per-iteration try/except: ids
+            # arrive as ints or digit strings, anything else just can't match
+            bid = bm.get("id")
+            if bid == want or (bid.__class__ is str and bid.strip() == want_s):
+                return bm
+            if first_with_bets is None and bm.get("bets"):
+                first_with_bets = bm
+    else:
+        for bm in bookmakers:
+            if bm.get("bets"):
+                first_with_bets = bm
+                break
+    return first_with_bets or bookmakers[0]
+
 
+@lru_cache(maxsize=4096)
+def _parse_odd_str(x: str) -> Optional[float]:
+    # Odds strings have tiny cardinality ("-110", "1.95", "2.5", ... repeat
+    # across every fixture), so parsing collapses to a dict hit almost always.
+    try:
+        return float(x.strip())
+    except ValueError:
+        return None
 
 def _to_float(x: Any) -> Optional[float]:
     if x is None:
         return None
+    cls = x.__class__
+    if cls is str:
+        return _parse_odd_str(x)
+    # some feeds send odds/handicaps already numeric: skip str+strip+parse
+    if cls is float:
+        return x
+    if cls is int:
+        return float(x)
     try:
         return float(str(x).strip())
     except Exception:
         return None
 
 
-def _contains_any(hay: str, needles: List[str]) -> bool:
-    h = hay.lower()
-    return any(n in h for n in needles)
-
+_DIGITS = frozenset("0123456789")
 
 def _extract_line(text: str) -> Optional[float]:
-    m = re.search(r"(-?\d+(?:\.\d+)?)", str(text))
-    return float(m.group(1)) if m else None
+    # Hand-rolled scan for the first -?digits[.digits] run. Labels are short
+    # ("Over 46.5", "Home -3.5"), so a direct walk beats regex dispatch; the
+    # matching is identical to the old r"(-?\d+(?:\.\d+)?)" search.
+    s = text if text.__class__ is str else str(text)
+    n = len(s)
+    i = 0
+    while i < n:
+        c = s[i]
+        if c in _DIGITS or (c == "-" and i + 1 < n and s[i + 1] in _DIGITS):
+            j = i + 1
+            seen_dot = False
+            while j < n:
+                cj = s[j]
+                if cj in _DIGITS:
+                    j += 1
+                elif cj == "." and not seen_dot and j + 1 < n and s[j + 1] in _DIGITS:
+                    seen_dot = True
+                    j += 1
+                else:
+                    break
+            return float(s[i:j])
+        i += 1
+    return None
 
 
 def _bet_name(bet: Dict[str, Any]) -> str:
     return str(bet.get("name") or "").strip()
 
 
-def _detect_alias(bet: Dict[str, Any]) -> Optional[str]:
-    """Try id-based classification first (if MAP present), then fall back to names."""
-    bid = str(bet.get("id") or "").strip()
+# Hoisted market-name tables: one shared frozenset per market instead of a
+# set rebuilt inside the detection path for every bet scanned.
+_ML_EXACT = frozenset({"1x2", "match odds", "match result"})
+# Exact outcome labels: one set probe replaces chained substring scans for
+# the overwhelmingly common short labels ("Home", "1", "X", ...).
+_HOME_EXACT = frozenset({"home", "1", "team 1", "1 (home)", "h"})
+_AWAY_EXACT = frozenset({"away", "2", "team 2", "2 (away)", "a"})
+_DRAW_EXACT = frozenset({"draw", "x", "tie"})
+_ML_SUBSTR = ("moneyline",)
+_SPREAD_SUBSTR = ("handicap", "spread")
+_TOTAL_SUBSTR = ("total", "over/under", "goals over/under")
+
+
+def _classify(bet: Dict[str, Any], league_bets: Optional[Dict[str, Any]] = None) -> Tuple[str, str, str]:
+    """Fused detection: lowercase the bet name once, classify alias and
+    period off that single string. Returns (alias_or_empty, period, name_lc)."""
     name = _bet_name(bet).lower()
+    return _alias_from(bet, name, league_bets) or "", _period_from(name), name
+
 
-    # Try id-based lookup across leagues if available
-    if bid and _MAP:
-        for _league, conf in _MAP.items():
-            if bid in (conf.get("bets") or {}):
-                alias = (conf["bets"][bid] or {}).get("alias")
-                if alias:
-                    return alias
-
-    # Name fallbacks
-    if _NAME_FALLBACKS:
-        for alias, keys in _NAME_FALLBACKS.items():
-            if _contains_any(name, [k.lower() for k in keys]):
+def _detect_alias(bet: Dict[str, Any], league_bets: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """Try id-based classification first (if MAP present), then fall back to names."""
+    return _alias_from(bet, _bet_name(bet).lower(), league_bets)
+
+
+def _alias_from(bet: Dict[str, Any], name: str, league_bets: Optional[Dict[Any, str]] = None) -> Optional[str]:
+    bid = bet.get("id")
+
+    if bid is not None:
+        # Known league: single dict probe into its flat id->alias table,
+        # keyed under both int and string ids so the raw value works as-is.
+        if league_bets is not None:
+            alias = league_bets.get(bid)
+            if alias:
                 return alias
+        elif _MAP:
+            # League unknown (legacy callers): scan across leagues as before.
+            bid_s = str(bid).strip()
+            for _league, conf in _MAP.items():
+                if bid_s in (conf.get("bets") or {}):
+                    alias = (conf["bets"][bid_s] or {}).get("alias")
+                    if alias:
+                        return alias
+
+    return _alias_from_name(name)
+
+
+@lru_cache(maxsize=1024)
+def _alias_from_name(name: str) -> Optional[str]:
+    # Bet names repeat across every fixture in a slate ("Moneyline",
+    # "Asian Handicap", ...), so after warmup this is a dict hit.
+    for needle, alias in _NAME_NEEDLES:
+        if needle in name:
+            return alias
 
     # Heuristic generic fallback
-    if "moneyline" in name or name in {"1x2", "match odds", "match result"}:
+    if name in _ML_EXACT or _ML_SUBSTR[0] in name:
         return "moneyline"
-    if "handicap" in name or "spread" in name:
-        return "spread"
-    if "total" in name or "over/under" in name or "goals over/under" in name:
-        return "total"
+    for n in _SPREAD_SUBSTR:
+        if n in name:
+            return "spread"
+    for n in _TOTAL_SUBSTR:
+        if n in name:
+            return "total"
     return None
 
 
 def _detect_period(bet: Dict[str, Any]) -> str:
     """Infer period from name using hints; default to 'game'."""
-    name = _bet_name(bet).lower()
-    if _PERIOD_HINTS:
-        for p, hints in _PERIOD_HINTS.items():
-            if _contains_any(name, [h.lower() for h in hints]):
-                return p
+    return _period_from(_bet_name(bet).lower())
+
+
+@lru_cache(maxsize=1024)
+def _period_from(name: str) -> str:
+    for needle, p in _PERIOD_NEEDLES:
+        if needle in name:
+            return p
     # Simple heuristics
     if "first half" in name or "1h" in name:
         return "1h"
@@ -203,21 +403,21 @@ def _map_moneyline(bet: Dict[str, Any]) -> Optional[Dict[str, Optional[float]]]:
         return None
     row = {"home": None, "away": None, "draw": None}
 
-    for v in values:
-        label = str(v.get("value") or "").lower()
-        price = _to_float(v.get("odd"))
-        if "home" in label or label == "1":
+    # Parse label/price once per outcome; the fallback pass below reuses the
+    # parsed rows instead of re-stringifying and re-parsing every value.
+    parsed = [(str(v.get("value") or "").lower(), _to_float(v.get("odd"))) for v in values]
+
+    for label, price in parsed:
+        if label in _HOME_EXACT or "home" in label:
             row["home"] = price
-        elif "away" in label or label == "2":
+        elif label in _AWAY_EXACT or "away" in label:
             row["away"] = price
-        elif "draw" in label or label in {"x"}:
+        elif label in _DRAW_EXACT or "draw" in label:
             row["draw"] = price
 
     # If nothing captured, some books put team names in value
     if row["home"] is None and row["away"] is None and row["draw"] is None:
-        for v in values:
-            label = str(v.get("value") or "").lower()
-            price = _to_float(v.get("odd"))
+        for label, price in parsed:
             # crude fallback: first two entries become home/away
             if row["home"] is None:
                 row["home"] = price
@@ -241,25 +441,24 @@ def _map_spread(bet: Dict[str, Any]) -> Optional[Dict[str, Optional[float]]]:
 
     agg = {"line": None, "home_price": None, "away_price": None}
 
+    first_line = None
     for v in values:
         val = str(v.get("value") or "").lower()
         odd = _to_float(v.get("odd"))
         # prefer explicit handicap if present (soccer)
         line = _to_float(v.get("handicap")) or _extract_line(val)
-        if "home" in val or val == "1":
+        if line is not None and first_line is None:
+            first_line = line
+        if val in _HOME_EXACT or "home" in val:
             agg["line"] = agg["line"] if agg["line"] is not None else line
             agg["home_price"] = odd
-        elif "away" in val or val == "2":
+        elif val in _AWAY_EXACT or "away" in val:
             agg["line"] = agg["line"] if agg["line"] is not None else line
             agg["away_price"] = odd
 
-    # If still no line, pick the first available numeric from any value
+    # If still no line, use the first numeric seen (tracked in the same pass)
     if agg["line"] is None:
-        for v in values:
-            line = _to_float(v.get("handicap")) or _extract_line(str(v.get("value") or ""))
-            if line is not None:
-                agg["line"] = line
-                break
+        agg["line"] = first_line
 
     return agg
 
@@ -276,39 +475,41 @@ def _map_total(bet: Dict[str, Any]) -> Optional[Dict[str, Optional[float]]]:
 
     agg = {"line": None, "over_price": None, "under_price": None}
 
+    first_line = None
     for v in values:
         val = str(v.get("value") or "").lower()
         odd = _to_float(v.get("odd"))
         line = _to_float(v.get("handicap")) or _extract_line(val)
+        if line is not None and first_line is None:
+            first_line = line
 
-        if "over" in val:
+        # startswith resolves the common "Over 46.5"/"Under 46.5" labels on
+        # the first character; the substring scan stays as fallback.
+        if val.startswith("over") or "over" in val:
             agg["line"] = line
             agg["over_price"] = odd
-        elif "under" in val:
+        elif val.startswith("under") or "under" in val:
             agg["line"] = line
             agg["under_price"] = odd
 
-    # If line still None, take the first numeric we can find
+    # If line still None, use the first numeric seen (tracked in the same pass)
     if agg["line"] is None:
-        for v in values:
-            line = _to_float(v.get("handicap")) or _extract_line(str(v.get("value") or ""))
-            if line is not None:
-                agg["line"] = line
-                break
+        agg["line"] = first_line
 
     return agg
 
 
-def _maybe_attach_prop(out: Dict[str, Any], bet: Dict[str, Any]) -> None:
+def _maybe_attach_prop(out: Dict[str, Any], bet: Dict[str, Any], name: Optional[str] = None) -> None:
     """Attach player/team props into out['props'] using fallback name patterns."""
     if not _PROP_FALLBACKS:
         return
 
-    name = _bet_name(bet).lower()
+    if name is None:
+        name = _bet_name(bet).lower()
     values = bet.get("values") or []
-    for prop_key, hints in _PROP_FALLBACKS.items():
-        if _contains_any(name, [h.lower() for h in hints]):
-            bucket: List[Dict[str, Any]] = out["props"].setdefault(prop_key, [])
+    for prop_key, hints in _PROP_FALLBACKS_LC.items():
+        if any(h in name for h in hints):
+            bucket: List[Dict[str, Any]] = out["props"][prop_key]
             for v in values:
                 entry = {
                     "player": v.get("player") or v.get("name"),
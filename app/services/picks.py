@@ -1,20 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from ..clients.apisports import ApiSportsClient, League
 from ..schemas.common import Pick
+from ..schemas.picks import PICKS_ADAPTER
+from .cache import odds_cache, slate_cache
 from .feature_store import rolling_off_def_rating
 from .models import fair_ml_prob, fair_spread, fair_total, american_to_prob, prob_to_american
 
-def _extract_team_stats(stats_payload: Dict[str, Any], team_name: str) -> Dict[str, Any]:
-    # Normalize a few common fields; adjust to your account’s schema if needed
-    out = {"games": None, "points_for": None, "points_against": None}
+def _extract_soccer_fixture(g: Dict[str, Any]) -> tuple:
+    """(fid, home_name, away_name) via direct indexing; no or-{} temporaries."""
+    return g["fixture"]["id"], g["teams"]["home"]["name"], g["teams"]["away"]["name"]
+
+def _extract_v1_fixture(g: Dict[str, Any]) -> tuple:
     try:
-        s = stats_payload.get("response") or stats_payload.get("statistics") or {}
-        # Very loose mapping: adapt per sport if keys differ
-        out["games"] = s.get("games", {}).get("played") or s.get("matches", {}).get("played")
-        out["points_for"] = (s.get("points", {}) or s.get("goals", {})).get("for")
-        out["points_against"] = (s.get("points", {}) or s.get("goals", {})).get("against")
-    except Exception:
+        fid = g["id"]
+        teams = g["teams"]
+        home = teams["home"]["name"]
+        away = teams["away"]["name"]
+        return fid, home, away
+    except (KeyError, TypeError):
         pass
+    fid = g.get("id") or g.get("game", {}).get("id") or g.get("fixture", {}).get("id")
+    home = g.get("teams", {}).get("home") or g.get("home")
+    away = g.get("teams", {}).get("away") or g.get("away")
+    home_name = (home.get("name") if isinstance(home, dict) else home) or "HOME"
+    away_name = (away.get("name") if isinstance(away, dict) else away) or "AWAY"
+    return fid, home_name, away_name
+
+def _extract_team_stats(stats_payload: Dict[str, Any], team_name: str) -> Dict[str, Any]:
+    # Normalize a few common fields; adjust to your account’s schema if needed.
+    # Guarded get-chains instead of a blanket try/except: malformed payloads
+    # fall through to None without paying exception unwinds in the loop.
+    out = {"games": None, "points_for": None, "points_against": None}
+    s = stats_payload.get("response") or stats_payload.get("statistics") or {}
+    if not isinstance(s, dict):
+        return out
+    games = s.get("games") or {}
+    matches = s.get("matches") or {}
+    if isinstance(games, dict):
+        out["games"] = games.get("played")
+    if out["games"] is None and isinstance(matches, dict):
+        out["games"] = matches.get("played")
+    pts = s.get("points") or s.get("goals") or {}
+    if isinstance(pts, dict):
+        out["points_for"] = pts.get("for")
+        out["points_against"] = pts.get("against")
     return out
 
 def build_picks(
@@ -25,36 +55,63 @@ def build_picks(
     bet_types: Optional[List[str]],
     league_id_override: Optional[int] = None
 ) -> List[Pick]:
-    games = client.fixtures_by_date(league, date, season=season, league_id=league_id_override)
+    slate_key = ("slate", league, date, season, league_id_override)
+    games = slate_cache.get(slate_key)
+    if games is None:
+        games = client.fixtures_by_date(league, date, season=season, league_id=league_id_override)
+        slate_cache.set(slate_key, games)
     fixtures = games.get("response") or games.get("results") or []
 
-    picks: List[Pick] = []
-    for g in fixtures:
-        # Normalize fixture fields across sports
-        if league == "soccer":
-            fid = g["fixture"]["id"]
-            home_name = g["teams"]["home"]["name"]
-            away_name = g["teams"]["away"]["name"]
-        else:
-            fid = g.get("id") or g.get("game", {}).get("id") or g.get("fixture", {}).get("id")
-            home = g.get("teams", {}).get("home") or g.get("home")
-            away = g.get("teams", {}).get("away") or g.get("away")
-            home_name = (home.get("name") if isinstance(home, dict) else home) or "HOME"
-            away_name = (away.get("name") if isinstance(away, dict) else away) or "AWAY"
+    extract = _extract_soccer_fixture if league == "soccer" else _extract_v1_fixture
 
-        # Team stats (very lightweight; expand with pace/possessions, etc.)
-        # In many API-SPORTS sports, a single endpoint returns per-team statistics for a season.
-        home_stats = client.teams_stats(league, season or 2024)
-        away_stats = client.teams_stats(league, season or 2024)
+    # Team stats (very lightweight; expand with pace/possessions, etc.)
+    # In many API-SPORTS sports, a single endpoint returns per-team statistics
+    # for a season — same args for every fixture, so fetch it once per slate
+    # instead of twice per game.
+    season_stats = client.teams_stats(league, season or 2024)
+
+    # Extract fixture fields first, then fetch the slate's odds in parallel:
+    # the lookups are independent and IO-bound, so overlapping the HTTP
+    # round-trips drops this stage from N*RTT to roughly one RTT per batch.
+    meta = [extract(g) for g in fixtures]
+    odds_by_fid: Dict[Any, Any] = {}
+    misses = []
+    for fid, _, _ in meta:
+        cached = odds_cache.get(("odds", league, fid))
+        if cached is None:
+            if fid not in odds_by_fid:
+                odds_by_fid[fid] = None
+                misses.append(fid)
+        else:
+            odds_by_fid[fid] = cached
+    if misses:
+        def _fetch(fid):
+            return fid, client.odds_for_fixture(league, fid)
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            for fid, payload in ex.map(_fetch, misses):
+                odds_cache.set(("odds", league, fid), payload)
+                odds_by_fid[fid] = payload
 
-        h_off, h_def = rolling_off_def_rating(home_stats)
-        a_off, a_def = rolling_off_def_rating(away_stats)
+    # Which bet types are wanted is loop-invariant; resolve it once and only
+    # run the model evaluations those types actually consume.
+    want_ml = (not bet_types) or ("moneyline" in bet_types)
+    want_sp = (not bet_types) or ("spread" in bet_types)
+    want_tot = (not bet_types) or ("total" in bet_types)
 
-        fair_p = fair_ml_prob(h_off, h_def, a_off, a_def)
-        fair_home_price = prob_to_american(fair_p)
+    # Until per-team stats are wired in, both sides read the same season
+    # payload, so the ratings and fair values are identical for every fixture
+    # on the slate: compute them once instead of per game.
+    h_off, h_def = rolling_off_def_rating(season_stats)
+    a_off, a_def = h_off, h_def
+    fair_p = fair_ml_prob(h_off, h_def, a_off, a_def) if (want_ml or want_sp or want_tot) else 0.0
+    fair_home_price = prob_to_american(fair_p) if want_ml else 0
+    fair_sp = fair_spread(h_off, h_def, a_off, a_def) if want_sp else 0.0
+    fair_tot = fair_total(h_off, a_off) if want_tot else 0.0
 
-        # Pull market odds (first book)
-        odds_payload = client.odds_for_fixture(league, fid)
+    picks: List[dict] = []  # validated in one adapter pass at the end
+    for fid, home_name, away_name in meta:
+        # Pull market odds (first book; fetched in the parallel pass above)
+        odds_payload = odds_by_fid.get(fid) or {}
         book_odds = None
         try:
             # Normalize odds shape; pick the first bookmaker
@@ -66,32 +123,30 @@ def build_picks(
             pass
 
         # Moneyline pick
-        if (not bet_types) or ("moneyline" in bet_types):
+        if want_ml:
             # Assume US prices; fallback if not present
             market_home_price = None
             if book_odds:
                 # Fill in from book_odds structure for your account
                 pass
             edge = fair_p - (american_to_prob(market_home_price) if market_home_price else 0.0)
-            picks.append(Pick(
+            picks.append(dict(
                 fixture_id=fid, league=league, bet_type="moneyline",
                 selection=home_name, line=None, price=market_home_price or fair_home_price,
                 edge=edge, win_prob=fair_p
             ))
 
         # Spread pick
-        if (not bet_types) or ("spread" in bet_types):
-            fair_sp = fair_spread(h_off, h_def, a_off, a_def)
-            picks.append(Pick(
+        if want_sp:
+            picks.append(dict(
                 fixture_id=fid, league=league, bet_type="spread",
                 selection=home_name, line=fair_sp, price=None,
                 edge=0.0, win_prob=fair_p  # replace edge when you map market spread
             ))
 
         # Total pick
-        if (not bet_types) or ("total" in bet_types):
-            fair_tot = fair_total(h_off, a_off)
-            picks.append(Pick(
+        if want_tot:
+            picks.append(dict(
                 fixture_id=fid, league=league, bet_type="total",
                 selection="over" if fair_tot > 0 else "under",
                 line=abs(fair_tot), price=None, edge=0.0, win_prob=fair_p
@@ -99,4 +154,4 @@ def build_picks(
 
         # Half/Quarter totals & player props: add once you map API-SPORTS props markets for each league.
 
-    return picks
+    return PICKS_ADAPTER.validate_python(picks)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import Dict, Any, List, Tuple
-from statistics import mean
 
 def _team_points(g: Dict[str, Any], home: bool) -> Tuple[int, int]:
     # v1 families
@@ -19,21 +18,28 @@ def compute_efficiency(games: List[Dict[str, Any]], team_name: str) -> Dict[str,
       DefEff = mean(points_against)
       Net    = OffEff - DefEff
     """
-    pf, pa = [], []
+    # Accumulate sums in one pass; statistics.mean is pure Python and much
+    # slower than a running total for ints, and this runs per team per slate.
+    n = 0
+    sum_pf = 0
+    sum_pa = 0
     for g in games:
         teams = g.get("teams") or {}
         h = (teams.get("home") or {}).get("name") or (g.get("home") or {}).get("name")
         a = (teams.get("away") or {}).get("name") or (g.get("away") or {}).get("name")
-        if not (h and a): 
+        if not (h and a):
             continue
         if team_name == h:
             f, ag = _team_points(g, home=True)
-            pf.append(f); pa.append(ag)
         elif team_name == a:
             f, ag = _team_points(g, home=False)
-            pf.append(f); pa.append(ag)
-    if not pf:
+        else:
+            continue
+        n += 1
+        sum_pf += f
+        sum_pa += ag
+    if not n:
         return {"off": 0.0, "def": 0.0, "net": 0.0}
-    off = float(mean(pf))
-    de = float(mean(pa))
+    off = sum_pf / n
+    de = sum_pa / n
     return {"off": round(off, 2), "def": round(de, 2), "net": round(off - de, 2)}
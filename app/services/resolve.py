@@ -1,27 +1,63 @@
 # app/services/resolve.py
 from __future__ import annotations
+from functools import lru_cache
+import heapq
 from typing import Dict, Any, Optional, Tuple, List
 import re
 
 from ..clients.apisports import ApiSportsClient, League
 
-# quick normalization
+# quick normalization; patterns compiled once — the bound .sub skips the
+# re-cache probe and argument parsing that re.sub pays per call
+_STOPWORDS_SUB = re.compile(r"\b(university|college|the|fc|sc|club|state)\b").sub
+_WS_SUB = re.compile(r"\s+").sub
+
+class _SpaceNonAlnum(dict):
+    """translate() table mapping every codepoint outside [a-z0-9] to a space.
+
+    Built lazily via __missing__ so we never enumerate Unicode up front; the
+    whitespace-collapse pass afterwards makes this equivalent to the old
+    [^a-z0-9]+ -> " " regex, with the filter running in C.
+    """
+    def __missing__(self, cp: int) -> str:
+        c = chr(cp)
+        r = c if ("a" <= c <= "z" or "0" <= c <= "9") else " "
+        self[cp] = r
+        return r
+
+_NORM_TABLE = _SpaceNonAlnum()
+
+@lru_cache(maxsize=4096)
 def _norm(s: str) -> str:
-    s = s.lower().strip()
-    s = re.sub(r"[^a-z0-9]+", " ", s)
-    s = re.sub(r"\b(university|college|the|fc|sc|club|state)\b", "", s)
-    return re.sub(r"\s+", " ", s).strip()
+    # Team names repeat heavily across a date's fixtures (and across
+    # requests), so normalization is a dict hit after first sight.
+    s = s.lower().strip().translate(_NORM_TABLE)
+    s = _STOPWORDS_SUB("", s)
+    return _WS_SUB(" ", s).strip()
+
+@lru_cache(maxsize=4096)
+def _tokens(s: str) -> frozenset:
+    # token sets are reused across comparisons (targets vs every row), so
+    # split/construct each normalized name once
+    return frozenset(s.split())
 
 def _ratio(a: str, b: str) -> float:
     # lightweight similarity: token overlap Jaccard + prefix bonus
-    ta, tb = set(a.split()), set(b.split())
+    return _ratio_tokens(_tokens(a), _tokens(b), bool(a and b and a[0] == b[0]))
+
+def _ratio_tokens(ta: frozenset, tb: frozenset, prefix_bonus: bool) -> float:
     inter = len(ta & tb)
-    union = max(1, len(ta | tb))
-    j = inter / union
-    if a and b and (a[0] == b[0]):
+    # |A ∪ B| = |A| + |B| − |A ∩ B|: sizes we already have, no union set built
+    union = len(ta) + len(tb) - inter
+    j = inter / union if union else 0.0
+    if prefix_bonus:
         j += 0.05
     return min(j, 1.0)
 
+# Candidates surfaced to callers (409 confirmations, /data/resolve): enough
+# for a human to pick from without serializing a whole date's slate.
+_TOP_K = 5
+
 _ALIAS: Dict[str, str] = {}  # normalized -> original seen
 def remember_alias(name: str) -> None:
     _ALIAS[_norm(name)] = name
@@ -37,6 +73,29 @@ def resolve_fixture_id(
     season: Optional[int] = None,
 ) -> Dict[str, Any]:
     fx = client.fixtures_by_date(league=league, date=date, season=season, league_id=league_id_override)
+    return _pick_fixture(fx, league=league, home=home, away=away)
+
+async def resolve_fixture_id_async(
+    client: "ApiSportsClient",
+    *,
+    league: League,
+    date: str,
+    home: Optional[str] = None,
+    away: Optional[str] = None,
+    league_id_override: Optional[int] = None,
+    season: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Async twin of resolve_fixture_id (expects an AsyncApiSportsClient)."""
+    fx = await client.fixtures_by_date(league=league, date=date, season=season, league_id=league_id_override)
+    return _pick_fixture(fx, league=league, home=home, away=away)
+
+def _pick_fixture(
+    fx: Dict[str, Any],
+    *,
+    league: League,
+    home: Optional[str],
+    away: Optional[str],
+) -> Dict[str, Any]:
     games = fx.get("response") or fx.get("results") or []
     if league == "soccer":
         rows = [{
@@ -47,32 +106,122 @@ def resolve_fixture_id(
     else:
         rows = []
         for g in games:
-            fid = g.get("id") or (g.get("game") or {}).get("id") or (g.get("fixture") or {}).get("id")
-            teams = g.get("teams") or {}
-            h = (teams.get("home") or {}).get("name") or (g.get("home") or {}).get("name")
-            a = (teams.get("away") or {}).get("name") or (g.get("away") or {}).get("name")
+            # EAFP: well-formed v1 rows index straight through; the defensive
+            # .get chains (each allocating fallback dicts) only run on the
+            # rare malformed row, where the exception cost is acceptable.
+            try:
+                fid = g["id"]
+                teams = g["teams"]
+                h = teams["home"]["name"]
+                a = teams["away"]["name"]
+            except (KeyError, TypeError):
+                fid = g.get("id") or (g.get("game") or {}).get("id") or (g.get("fixture") or {}).get("id")
+                teams = g.get("teams") or {}
+                h = (teams.get("home") or {}).get("name") or (g.get("home") or {}).get("name")
+                a = (teams.get("away") or {}).get("name") or (g.get("away") or {}).get("name")
             if fid and h and a:
                 rows.append({"fixture_id": int(fid), "home": h, "away": a})
 
     target_h = _norm(home or "")
     target_a = _norm(away or "")
 
+    # Nothing to match against: skip the scoring loop outright and just
+    # report a handful of the slate as candidates.
+    if not (target_h or target_a):
+        cands = [{"fixture_id": r["fixture_id"], "home": r["home"], "away": r["away"], "score": 0.0} for r in rows[:_TOP_K]]
+        return {"fixture_id": None, "candidates": cands, "picked_reason": None}
+    th_tokens = _tokens(target_h)
+    ta_tokens = _tokens(target_a)
+    th_first = target_h[:1]
+    ta_first = target_a[:1]
+
+    # Happy path: clean inputs match a row exactly after normalization, so a
+    # single equality pass settles it with no token sets or scoring at all.
+    if target_h and target_a:
+        for r in rows:
+            if _norm(r["home"]) == target_h and _norm(r["away"]) == target_a:
+                cand = {"fixture_id": r["fixture_id"], "home": r["home"], "away": r["away"], "score": 2.0}
+                return {"fixture_id": r["fixture_id"], "candidates": [cand], "picked_reason": "Exact team match."}
+
+    n_th = len(th_tokens)
+    n_ta = len(ta_tokens)
+
     best: Tuple[int, float, Dict[str, Any]] = (-1, -1.0, {})
-    cands: List[Dict[str, Any]] = []
-    for r in rows:
+    # (score, row index) pairs; candidate dicts are only built for the top-K
+    # at the end rather than for every row on the date
+    scores: List[Tuple[float, int]] = []
+    # rows skipped by the bound check, kept aside with their bound: a bound
+    # overestimates the true score, so it must never rank in the top-K as-is
+    pruned: List[Tuple[float, int]] = []
+    for i, r in enumerate(rows):
         remember_alias(r["home"]); remember_alias(r["away"])
-        score = 0.0
+        h_toks = a_toks = None
+        hn = an = ""
+        # Jaccard can't exceed min(|A|,|B|)/max(|A|,|B|); sum those cheap
+        # bounds (plus the possible prefix bonus) and skip the set
+        # intersections entirely for rows that can't beat the current best.
+        bound = 0.0
         if target_h:
-            score += _ratio(target_h, _norm(r["home"]))
+            hn = _norm(r["home"])
+            h_toks = _tokens(hn)
+            n = len(h_toks)
+            bound += (min(n_th, n) / (max(n_th, n) or 1)) + 0.05
         if target_a:
-            score += _ratio(target_a, _norm(r["away"]))
-        cands.append({"fixture_id": r["fixture_id"], "home": r["home"], "away": r["away"], "score": round(score, 3)})
+            an = _norm(r["away"])
+            a_toks = _tokens(an)
+            n = len(a_toks)
+            bound += (min(n_ta, n) / (max(n_ta, n) or 1)) + 0.05
+        if bound <= best[1]:
+            # non-contender for the pick; may still need an exact score below
+            # if its bound reaches candidate range
+            pruned.append((bound, i))
+            continue
+        score = 0.0
+        if h_toks is not None:
+            score += _ratio_tokens(th_tokens, h_toks, bool(th_first) and hn[:1] == th_first)
+        if a_toks is not None:
+            score += _ratio_tokens(ta_tokens, a_toks, bool(ta_first) and an[:1] == ta_first)
+        scores.append((round(score, 3), i))
         if score > best[1]:
             best = (r["fixture_id"], score, r)
 
+    # Exact-score, in descending bound order, only the pruned rows whose
+    # bound still clears the K-th best exact score; bound >= actual means
+    # the rest can't crack the top-K, and the picked fixture is unaffected
+    # because a pruned row's true score never exceeded best at prune time.
+    if pruned:
+        top = heapq.nlargest(_TOP_K, (sc for sc, _ in scores))
+        kth = top[-1] if len(top) == _TOP_K else -1.0
+        heapq.heapify(top)
+        pruned.sort(reverse=True)
+        for b, i in pruned:
+            if len(top) == _TOP_K and b <= kth:
+                break
+            r = rows[i]
+            score = 0.0
+            if target_h:
+                hn = _norm(r["home"])
+                score += _ratio_tokens(th_tokens, _tokens(hn), bool(th_first) and hn[:1] == th_first)
+            if target_a:
+                an = _norm(r["away"])
+                score += _ratio_tokens(ta_tokens, _tokens(an), bool(ta_first) and an[:1] == ta_first)
+            sc = round(score, 3)
+            scores.append((sc, i))
+            if len(top) < _TOP_K:
+                heapq.heappush(top, sc)
+            else:
+                heapq.heappushpop(top, sc)
+            if len(top) == _TOP_K:
+                kth = top[0]
+
     # Threshold: require higher score when both home+away provided
     threshold = 1.2 if (target_h and target_a) else 0.6
     picked = best[0] if (best[0] != -1 and best[1] >= threshold) else None
 
+    cands = [
+        {"fixture_id": rows[i]["fixture_id"], "home": rows[i]["home"], "away": rows[i]["away"], "score": sc}
+        for sc, i in heapq.nlargest(_TOP_K, scores)
+    ]
+
     picked_reason = "High-confidence team match." if picked is not None else None
     return {"fixture_id": picked, "candidates": cands, "picked_reason": picked_reason}
@@ -1,5 +1,16 @@
 from __future__ import annotations
 
-def lc_in(s: str, needles: list[str]) -> bool:
+from typing import Iterable, Optional
+
+def lc_in(s: str, needles: Iterable[str]) -> bool:
     s = s.lower()
     return any(n in s for n in needles)
+
+def lc_which(s: str, needles: Iterable[str]) -> Optional[str]:
+    """Like lc_in, but returns the first matching needle so callers can
+    classify and match in a single scan instead of two."""
+    s = s.lower()
+    for n in needles:
+        if n in s:
+            return n
+    return None
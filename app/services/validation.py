@@ -1,53 +1,96 @@
 # app/services/validation.py
 from __future__ import annotations
 
-from typing import Dict, Iterable, Optional, Set, Tuple
+import sys
+from typing import Dict, Iterable, Optional, Tuple
 from fastapi import HTTPException
 
-# Leagues your app currently supports everywhere
-ACCEPTED_LEAGUES: Set[str] = {"nba", "nfl", "ncaaf", "ncaab", "soccer"}
+# Leagues your app currently supports everywhere (frozen: constant, and a
+# frozenset membership probe is marginally cheaper than a mutable set's)
+ACCEPTED_LEAGUES: frozenset = frozenset({"nba", "nfl", "ncaaf", "ncaab", "soccer"})
+
+# Interned canonical values: the common case is an already-valid lowercase
+# league, so membership here is a pointer-fast check with zero allocation.
+_CANONICAL = frozenset(sys.intern(s) for s in ACCEPTED_LEAGUES)
+
+# Friendly spellings -> canonical league. Kept to genuine aliases only:
+# canonical values resolve via the (smaller, cache-friendlier) frozenset
+# after case-folding, so no identity entries bloating the dict.
+_LEAGUE_ALIASES: Dict[str, str] = {
+    "cfb": "ncaaf",
+    "college-football": "ncaaf",
+    "cbb": "ncaab",
+    "college-basketball": "ncaab",
+    "epl": "soccer",
+    "football": "soccer",  # API-Football naming
+}
+
+# Precomputed once: the 422 detail payload should not re-list the alias
+# table on every invalid request, and the exception itself is reusable.
+_ALLOWED_LEAGUES: list = sorted(ACCEPTED_LEAGUES | set(_LEAGUE_ALIASES))
+_LEAGUE_ERR = HTTPException(
+    status_code=422,
+    detail={"message": "Invalid league", "expected": _ALLOWED_LEAGUES},
+)
 
 # For each (league, operation) pair, list the **provider-facing** params
 # we purposely allow to pass through. Everything else should be rejected.
 # Only include keys you actually forward to the API-SPORTS client.
-_ALLOWED: Dict[Tuple[str, str], Set[str]] = {
+_ALLOWED: Dict[Tuple[str, str], frozenset] = {
     # -------- injuries --------
-    ("nfl", "injuries"): {"team", "player"},
-    ("ncaaf", "injuries"): {"team", "player"},
-    ("soccer", "injuries"): {"league", "season", "team", "player"},
+    ("nfl", "injuries"): frozenset({"team", "player"}),
+    ("ncaaf", "injuries"): frozenset({"team", "player"}),
+    ("soccer", "injuries"): frozenset({"league", "season", "team", "player"}),
     # nba/ncaab: not supported by provider — handled in the route
 
     # -------- odds --------
     # In routes we forward ONLY bookmaker → "bookmaker" and bet → "bet"
-    ("nfl", "odds"): {"bookmaker", "bet"},
-    ("ncaaf", "odds"): {"bookmaker", "bet"},
-    ("soccer", "odds"): {"bookmaker", "bet"},
+    ("nfl", "odds"): frozenset({"bookmaker", "bet"}),
+    ("ncaaf", "odds"): frozenset({"bookmaker", "bet"}),
+    ("soccer", "odds"): frozenset({"bookmaker", "bet"}),
 
     # (Optional) add more when you start passing extra filters
     # ("soccer","fixtures"): {"date","from","to","league","season","team"},
 }
+_NO_PARAMS: frozenset = frozenset()
 
 def _fmt_expected() -> str:
     return ", ".join(sorted(ACCEPTED_LEAGUES))
 
+def _parse_league(value: str) -> str:
+    """
+    Normalize a league string to its canonical lowercase form.
+    Fast path: already-canonical input skips strip/lower entirely.
+    """
+    if value in _CANONICAL:
+        return value  # common case, no alloc
+    # fallback: only pay for strip() when whitespace is actually present
+    if value[:1].isspace() or value[-1:].isspace():
+        value = value.strip()
+    folded = value.lower()
+    if folded in _CANONICAL:
+        return folded
+    league = _LEAGUE_ALIASES.get(folded)
+    if league is None:
+        raise _LEAGUE_ERR
+    return league
+
 def validate_league(league: str) -> None:
     """
-    Ensure the league value matches one of your supported literals exactly.
-    This gives a clean 422 even if a caller bypasses Pydantic's Literal.
+    Ensure the league value matches one of your supported literals
+    (or a known alias). This gives a clean 422 even if a caller
+    bypasses Pydantic's Literal.
     """
-    if league not in ACCEPTED_LEAGUES:
-        raise HTTPException(
-            status_code=422,
-            detail={"message": "Invalid league", "input": league, "expected": sorted(ACCEPTED_LEAGUES)},
-        )
+    _parse_league(league)
 
 def reject_unknown_params(league: str, operation: str, provider_params: Dict[str, object]) -> None:
     """
     For a given (league, operation) allow only a small, explicit set of
     provider-facing keys to pass downstream. Everything else is rejected early.
     """
-    allowed = _ALLOWED.get((league, operation), set())
-    unknown = set(provider_params.keys()) - allowed
+    allowed = _ALLOWED.get((league, operation), _NO_PARAMS)
+    # dict keys support set difference directly; no intermediate set() copy
+    unknown = provider_params.keys() - allowed
     if unknown:
         raise HTTPException(
             status_code=422,
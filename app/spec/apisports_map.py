@@ -12,7 +12,9 @@ PROP_FALLBACKS     : name-based classifiers for player props
 APISPORTS_SPEC     : minimal op schema per league family
 """
 
-__all__ = ["MAP", "NAME_FALLBACKS", "PERIOD_HINTS", "PROP_FALLBACKS", "APISPORTS_SPEC"]
+from types import MappingProxyType
+
+__all__ = ["MAP", "MAP_INT", "NAME_FALLBACKS", "PERIOD_HINTS", "PROP_FALLBACKS", "NAME_INDEX", "PERIOD_INDEX", "APISPORTS_SPEC"]
 
 # =========================
 # FAST PATH: id-based map
@@ -122,11 +124,33 @@ PROP_FALLBACKS: dict[str, list[str]] = {
     "touchdowns":      ["touchdowns"],
 }
 
+# Int-keyed twin of MAP: providers hand back integer bet ids, so consumers
+# probing MAP's JSON-safe string keys had to str() every id first. Built once
+# here; inner tables are read-only views of the same bet metadata.
+MAP_INT: dict[str, "MappingProxyType"] = {
+    _lg: MappingProxyType({int(_k): _v for _k, _v in _conf["bets"].items()})
+    for _lg, _conf in MAP.items()
+}
+
+# Inverted needle -> label indexes for the fallback classifiers: consumers
+# get a flat, already-lowercased mapping instead of re-walking the
+# alias -> needle-list tables per lookup. First-listed alias wins for any
+# needle that appears under several labels.
+NAME_INDEX: dict[str, str] = {}
+for _alias, _needles in NAME_FALLBACKS.items():
+    for _n in _needles:
+        NAME_INDEX.setdefault(_n.lower(), _alias)
+PERIOD_INDEX: dict[str, str] = {}
+for _period, _needles in PERIOD_HINTS.items():
+    for _n in _needles:
+        PERIOD_INDEX.setdefault(_n.lower(), _period)
+del _alias, _period, _needles, _n
+
 # ======================================
 # Minimal operation schema per family
 # (informational/validation only)
 # ======================================
-APISPORTS_SPEC = {
+APISPORTS_SPEC: "MappingProxyType" = MappingProxyType({
     "nfl": {
         "base": "https://v1.american-football.api-sports.io",
         "ops": {
@@ -172,4 +196,13 @@ APISPORTS_SPEC = {
             "injuries":         {"path": "/injuries", "required": ["league", "season"], "optional": ["team", "player"]},
         },
     },
-}
+})
+
+# Precompute the per-op param sets once at import: validators read
+# op["allowed"] / op["required_set"] as frozen constants instead of
+# rebuilding set(required) | set(optional) on every request.
+for _family in APISPORTS_SPEC.values():
+    for _op in _family["ops"].values():
+        _op["required_set"] = frozenset(_op["required"])
+        _op["allowed"] = _op["required_set"] | frozenset(_op["optional"])
+del _family, _op
@@ -1,21 +1,46 @@
 
 import time
-from typing import Any, Callable, Dict, Tuple
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Tuple
 
 class TTLCache:
-    def __init__(self, ttl_seconds: int = 120):
+    # monotonic is cheaper than wall-clock time and immune to clock steps
+    _now = time.monotonic
+
+    def __init__(self, ttl_seconds: int = 120, maxsize: int = 1024):
         self.ttl = ttl_seconds
-        self._store: Dict[Tuple[str, Tuple, Tuple], Tuple[float, Any]] = {}
+        self.maxsize = maxsize
+        # Insertion-ordered so the oldest entries sit at the front: writes can
+        # pop expired/overflow entries from there instead of growing forever.
+        self._store: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
 
     def cached(self, fn: Callable):
+        name = fn.__name__  # bound once at decoration, not per call
+        store = self._store
+
+        @wraps(fn)
         def wrapper(*args, **kwargs):
-            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
-            now = time.time()
-            if key in self._store:
-                ts, val = self._store[key]
-                if now - ts < self.ttl:
-                    return val
+            # kwargs keep call-site order (CPython 3.7+); skipping the sort
+            # means a caller varying keyword order misses the cache once,
+            # which is harmless, instead of every call paying O(k log k).
+            key = (name, args, tuple(kwargs.items()) if kwargs else ())
+            now = TTLCache._now()
+            hit = store.get(key)
+            if hit is not None and now < hit[0]:
+                store.move_to_end(key)  # recently used survives eviction
+                return hit[1]
             val = fn(*args, **kwargs)
-            self._store[key] = (now, val)
+            # amortized cleanup: shed expired entries from the front, then
+            # enforce the size bound, so the store stays O(maxsize) for good
+            while store:
+                k, (exp, _) = next(iter(store.items()))
+                if exp < now:
+                    del store[k]
+                else:
+                    break
+            while len(store) >= self.maxsize:
+                store.popitem(last=False)
+            store[key] = (now + self.ttl, val)
             return val
         return wrapper